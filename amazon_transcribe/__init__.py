@@ -14,9 +14,11 @@
 
 __version__ = "0.6.2"
 
-from awscrt.io import ClientBootstrap
-
 
 class AWSCRTEventLoop:
     def __init__(self):
+        # The CRT is imported lazily so that importing the model and
+        # serialization modules doesn't load the native extension
+        from awscrt.io import ClientBootstrap
+
         self.bootstrap = ClientBootstrap.get_or_create_static_default()
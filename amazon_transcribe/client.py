@@ -12,7 +12,6 @@
 # language governing permissions and limitations under the License.
 
 
-import re
 from binascii import unhexlify
 from typing import Optional
 
@@ -59,6 +58,7 @@ class TranscribeStreamingClient:
         self._endpoint_resolver = endpoint_resolver
         self.service_name = "transcribe"
         self.region = region
+        self._request_signer = SigV4RequestSigner(self.service_name, self.region)
         self._event_signer = EventSigner(self.service_name, self.region)
         self._eventloop = AWSCRTEventLoop().bootstrap
         if credential_resolver is None:
@@ -168,8 +168,7 @@ class TranscribeStreamingClient:
         ).prepare()
 
         creds = await self._credential_resolver.get_credentials()
-        signer = SigV4RequestSigner("transcribe", self.region)
-        signed_request = signer.sign(request, creds)
+        signed_request = await self._request_signer.sign_async(request, creds)
 
         response = await self._session_manager.make_request(
             signed_request.uri,
@@ -213,5 +212,5 @@ class TranscribeStreamingClient:
 
     def _extract_signature(self, signed_request):
         auth = signed_request.headers.get("Authorization", "")
-        auth = re.split("Signature=", auth)[-1]
+        auth = auth.rpartition("Signature=")[2]
         return unhexlify(auth)
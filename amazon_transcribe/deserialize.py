@@ -11,7 +11,13 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import json
-from typing import Optional, Type, Any, List
+from typing import Dict, Optional, Type, Any, List
+
+try:
+    # orjson is an optional, faster decoder for the JSON event payloads
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 import amazon_transcribe.exceptions as transcribe_exceptions
 from amazon_transcribe.eventstream import BaseEvent
@@ -44,6 +50,48 @@ class TranscribeStreamingResponseParser:
     This class is not public and must not be consumed outside of this project.
     """
 
+    # Modeled exceptions keyed by the error code returned by the service
+    _ERROR_CODE_EXCEPTIONS: Dict[str, Type[ServiceException]] = {
+        "BadRequestException": BadRequestException,
+        "ConflictException": ConflictException,
+        "InternalFailureException": InternalFailureException,
+        "LimitExceededException": LimitExceededException,
+        "ServiceUnavailableException": ServiceUnavailableException,
+        "SerializationException": SerializationException,
+    }
+
+    # Response headers mapped to the StartStreamTranscriptionResponse
+    # attributes they populate, grouped by how their values are converted
+    _RESPONSE_HEADERS = (
+        ("x-amzn-request-id", "request_id"),
+        ("x-amzn-transcribe-language-code", "language_code"),
+        ("x-amzn-transcribe-media-encoding", "media_encoding"),
+        ("x-amzn-transcribe-vocabulary-name", "vocabulary_name"),
+        ("x-amzn-transcribe-session-id", "session_id"),
+        ("x-amzn-transcribe-vocabulary-filter-name", "vocab_filter_name"),
+        ("x-amzn-transcribe-vocabulary-filter-method", "vocab_filter_method"),
+        (
+            "x-amzn-transcribe-partial-results-stability",
+            "partial_results_stability",
+        ),
+        ("x-amzn-transcribe-language-model-name", "language_model_name"),
+    )
+    _BOOLEAN_RESPONSE_HEADERS = (
+        ("x-amzn-transcribe-show-speaker-label", "show_speaker_label"),
+        (
+            "x-amzn-transcribe-enable-channel-identification",
+            "enable_channel_identification",
+        ),
+        (
+            "x-amzn-transcribe-enable-partial-results-stabilization",
+            "enable_partial_results_stabilization",
+        ),
+    )
+    _INTEGER_RESPONSE_HEADERS = (
+        ("x-amzn-transcribe-number-of-channels", "number_of_channels"),
+        ("x-amzn-transcribe-sample-rate", "media_sample_rate_hz"),
+    )
+
     def _get_error_code(self, http_response: Response) -> str:
         error_code = "Unknown"
         if "x-amzn-errortype" in http_response.headers:
@@ -54,8 +102,10 @@ class TranscribeStreamingResponseParser:
 
     def _get_error_message(self, body_bytes: bytes) -> str:
         error_message = "An unknown error was returned by the service"
+        if not body_bytes.strip():
+            return error_message
         try:
-            parsed_body = json.loads(body_bytes)
+            parsed_body = _json_loads(body_bytes)
         except json.decoder.JSONDecodeError:
             return error_message
         if "Message" in parsed_body:
@@ -69,18 +119,9 @@ class TranscribeStreamingResponseParser:
     ) -> ServiceException:
         error_code = self._get_error_code(http_response)
         error_message = self._get_error_message(body_bytes)
-        if error_code == "BadRequestException":
-            return BadRequestException(error_message)
-        elif error_code == "ConflictException":
-            return ConflictException(error_message)
-        elif error_code == "InternalFailureException":
-            return InternalFailureException(error_message)
-        elif error_code == "LimitExceededException":
-            return LimitExceededException(error_message)
-        elif error_code == "ServiceUnavailableException":
-            return ServiceUnavailableException(error_message)
-        elif error_code == "SerializationException":
-            return SerializationException(error_message)
+        exception_cls = self._ERROR_CODE_EXCEPTIONS.get(error_code)
+        if exception_cls is not None:
+            return exception_cls(error_message)
         return UnknownServiceException(
             http_response.status_code,
             error_code,
@@ -93,32 +134,13 @@ class TranscribeStreamingResponseParser:
         body_stream: Any,
     ) -> StartStreamTranscriptionResponse:
         headers = http_response.headers
-        request_id = headers.get("x-amzn-request-id")
-        language_code = headers.get("x-amzn-transcribe-language-code")
-        media_encoding = headers.get("x-amzn-transcribe-media-encoding")
-        vocabulary_name = headers.get("x-amzn-transcribe-vocabulary-name")
-        session_id = headers.get("x-amzn-transcribe-session-id")
-        vocab_filter_name = headers.get("x-amzn-transcribe-vocabulary-filter-name")
-        vocab_filter_method = headers.get("x-amzn-transcribe-vocabulary-filter-method")
-        show_speaker_label = self._raw_value_to_bool(
-            headers.get("x-amzn-transcribe-show-speaker-label")
-        )
-        enable_channel_identification = self._raw_value_to_bool(
-            headers.get("x-amzn-transcribe-enable-channel-identification")
-        )
-        number_of_channels = self._raw_value_to_int(
-            headers.get("x-amzn-transcribe-number-of-channels")
-        )
-        media_sample_rate_hz = self._raw_value_to_int(
-            headers.get("x-amzn-transcribe-sample-rate")
-        )
-        enable_partial_results_stabilization = self._raw_value_to_bool(
-            headers.get("x-amzn-transcribe-enable-partial-results-stabilization")
-        )
-        partial_results_stability = headers.get(
-            "x-amzn-transcribe-partial-results-stability"
-        )
-        language_model_name = headers.get("x-amzn-transcribe-language-model-name")
+        response_fields: Dict[str, Any] = {
+            attr: headers.get(header) for header, attr in self._RESPONSE_HEADERS
+        }
+        for header, attr in self._BOOLEAN_RESPONSE_HEADERS:
+            response_fields[attr] = self._raw_value_to_bool(headers.get(header))
+        for header, attr in self._INTEGER_RESPONSE_HEADERS:
+            response_fields[attr] = self._raw_value_to_int(headers.get(header))
 
         transcript_result_stream = TranscriptResultStream(
             body_stream, TranscribeStreamingEventParser()
@@ -126,20 +148,7 @@ class TranscribeStreamingResponseParser:
 
         parsed_response = StartStreamTranscriptionResponse(
             transcript_result_stream=transcript_result_stream,
-            request_id=request_id,
-            language_code=language_code,
-            media_sample_rate_hz=media_sample_rate_hz,
-            media_encoding=media_encoding,
-            vocabulary_name=vocabulary_name,
-            session_id=session_id,
-            vocab_filter_name=vocab_filter_name,
-            vocab_filter_method=vocab_filter_method,
-            show_speaker_label=show_speaker_label,
-            enable_channel_identification=enable_channel_identification,
-            number_of_channels=number_of_channels,
-            enable_partial_results_stabilization=enable_partial_results_stabilization,
-            partial_results_stability=partial_results_stability,
-            language_model_name=language_model_name,
+            **response_fields,
         )
         return parsed_response
 
@@ -161,7 +170,7 @@ class TranscribeStreamingEventParser:
             raise self._parse_event_exception(raw_event)
         elif message_type == "event":
             event_type = raw_event.headers.get(":event-type")
-            raw_body = json.loads(raw_event.payload)
+            raw_body = _json_loads(raw_event.payload)
             if event_type == "TranscriptEvent":
                 # TODO: Handle cases where the service returns an incorrect response
                 return self._parse_transcript_event(raw_body)
@@ -221,7 +230,7 @@ class TranscribeStreamingEventParser:
             transcribe_exceptions, exception_type, ServiceException
         )
         try:
-            raw_body = json.loads(raw_event.payload)
+            raw_body = _json_loads(raw_event.payload)
         except ValueError:
             raw_body = {}
         exception_msg = raw_body.get("Message", "An unknown service exception occured")
@@ -11,6 +11,8 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+from functools import lru_cache
+
 
 class BaseEndpointResolver:
     """Asynchronous endpoint resolver"""
@@ -34,4 +36,11 @@ class StaticEndpointResolver(BaseEndpointResolver):
 class _TranscribeRegionEndpointResolver(BaseEndpointResolver):
     async def resolve(self, region: str) -> str:
         """Apply region to transcribe uri template."""
-        return f"https://transcribestreaming.{region}.amazonaws.com"
+        return _regional_endpoint(region)
+
+
+@lru_cache(maxsize=64)
+def _regional_endpoint(region: str) -> str:
+    # Returning the same string object per region also lets the endpoint
+    # hostname cache hit on a precomputed hash and an identity check
+    return f"https://transcribestreaming.{region}.amazonaws.com"
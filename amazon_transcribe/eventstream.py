@@ -11,12 +11,26 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """Binary Event Stream Decoding """
+import sys
 import uuid
 import datetime
-from typing import Any, Callable, Dict, AsyncGenerator, Optional, Tuple, Union, Type
-
-from binascii import crc32
-from struct import unpack, pack
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    AsyncGenerator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    Type,
+    TYPE_CHECKING,
+)
+
+from zlib import crc32
+from struct import Struct
 
 from amazon_transcribe.structures import BufferableByteStream
 
@@ -26,7 +40,11 @@ from amazon_transcribe.structures import BufferableByteStream
 import hmac
 from hashlib import sha256
 from binascii import hexlify
-from amazon_transcribe.auth import Credentials
+
+if TYPE_CHECKING:
+    # Credentials are only needed for type hints, importing the auth module
+    # at runtime would load the CRT along with the event stream parser
+    from amazon_transcribe.auth import Credentials
 
 
 # byte length of the prelude (total_length + header_length + prelude_crc)
@@ -35,6 +53,20 @@ _MAX_HEADERS_LENGTH = 128 * 1024  # 128 Kb
 _MAX_HEADER_VALUE_BYTE_LENGTH = 32 * 1024 - 1
 _MAX_PAYLOAD_LENGTH = 16 * 1024**2  # 16 Mb
 
+# Precompiled formats for the fields written on every serialized message
+_PRELUDE_STRUCT = Struct("!II")  # total_length + header_length
+_CRC_STRUCT = Struct("!I")
+# Formats used to encode header names and values
+_UINT8_STRUCT = Struct("!B")
+_UINT16_STRUCT = Struct("!H")
+_INT8_STRUCT = Struct("!b")
+_INT16_STRUCT = Struct("!h")
+_INT32_STRUCT = Struct("!i")
+_INT64_STRUCT = Struct("!q")
+# Timezone aware timestamps are encoded as milliseconds from the epoch
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_ONE_MILLISECOND = datetime.timedelta(milliseconds=1)
+
 HEADER_VALUE = Union[bool, bytes, int, str]
 
 
@@ -123,6 +155,8 @@ class PayloadBytesExceedMaxLength(SerializationError):
 class HeaderValue:
     """A wrapper class for explicit header serialization."""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         raise NotImplementedError
 
@@ -130,6 +164,8 @@ class HeaderValue:
 class Int8HeaderValue(HeaderValue):
     """Value that should be explicitly serialized as an int8."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: int):
         self.value = value
 
@@ -137,6 +173,8 @@ class Int8HeaderValue(HeaderValue):
 class Int16HeaderValue(HeaderValue):
     """Value that should be explicitly serialized as an int16"""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: int):
         self.value = value
 
@@ -144,6 +182,8 @@ class Int16HeaderValue(HeaderValue):
 class Int32HeaderValue(HeaderValue):
     """Value that should be explicitly serialized as an int32"""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: int):
         self.value = value
 
@@ -151,6 +191,8 @@ class Int32HeaderValue(HeaderValue):
 class Int64HeaderValue(HeaderValue):
     """Value that should be explicitly serialized as an int64"""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: int):
         self.value = value
 
@@ -160,12 +202,49 @@ HEADER_SERIALIZATION_VALUE = Union[
     bool, bytes, int, str, uuid.UUID, datetime.datetime, HeaderValue
 ]
 HEADERS_SERIALIZATION_DICT = Dict[str, HEADER_SERIALIZATION_VALUE]
+HEADERS_SERIALIZATION_MAPPING = Mapping[str, HEADER_SERIALIZATION_VALUE]
+
+
+class FrozenHeaders(Mapping[str, HEADER_SERIALIZATION_VALUE]):
+    """Immutable copy of a set of event headers.
+
+    Frozen headers can't change once created, so their encoding is cached
+    by the serializer and reused for every event they're sent with.
+    """
+
+    def __init__(self, headers: HEADERS_SERIALIZATION_MAPPING):
+        self._headers = dict(headers)
+
+    def __getitem__(self, key: str) -> HEADER_SERIALIZATION_VALUE:
+        return self._headers[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._headers)
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._headers!r})"
 
 
 class EventStreamMessageSerializer:
     DEFAULT_INT_TYPE: Type[HeaderValue] = Int32HeaderValue
+    # Upper bound on the number of distinct header names cached per serializer
+    _MAX_CACHED_HEADER_KEYS = 64
 
-    def serialize(self, headers: HEADERS_SERIALIZATION_DICT, payload: bytes) -> bytes:
+    def __init__(self):
+        # Frozen headers are typically shared across every event of a
+        # given type, the last ones seen are cached alongside their encoding
+        self._frozen_headers: Optional[FrozenHeaders] = None
+        self._frozen_headers_encoded: bytes = b""
+        # The same few header names are sent with every event, so their
+        # length prefixed encodings are kept rather than rebuilt each time
+        self._encoded_header_keys: Dict[str, bytes] = {}
+
+    def serialize(
+        self, headers: HEADERS_SERIALIZATION_MAPPING, payload: bytes
+    ) -> bytes:
         # TODO: Investigate preformance of this once we can make requests
         if len(payload) > _MAX_PAYLOAD_LENGTH:
             raise PayloadBytesExceedMaxLength(len(payload))
@@ -177,67 +256,127 @@ class EventStreamMessageSerializer:
         prelude_bytes = self._encode_prelude(encoded_headers, payload)
         # Calculate the prelude_crc and it's byte representation
         prelude_crc = self._calculate_checksum(prelude_bytes)
-        prelude_crc_bytes = pack("!I", prelude_crc)
-        messages_bytes = prelude_crc_bytes + encoded_headers + payload
-        # Calculate the checksum continuing from the prelude crc
-        final_crc = self._calculate_checksum(messages_bytes, crc=prelude_crc)
-        final_crc_bytes = pack("!I", final_crc)
-        return prelude_bytes + messages_bytes + final_crc_bytes
-
-    def encode_headers(self, headers: HEADERS_SERIALIZATION_DICT) -> bytes:
-        encoded = b""
+        prelude_crc_bytes = _CRC_STRUCT.pack(prelude_crc)
+        # Calculate the checksum continuing from the prelude crc, each part
+        # is checksummed separately to avoid concatenating the payload
+        final_crc = self._calculate_checksum(prelude_crc_bytes, crc=prelude_crc)
+        final_crc = self._calculate_checksum(encoded_headers, crc=final_crc)
+        final_crc = self._calculate_checksum(payload, crc=final_crc)
+        final_crc_bytes = _CRC_STRUCT.pack(final_crc)
+        # The payload is only copied once, when the message is joined
+        return b"".join(
+            (
+                prelude_bytes,
+                prelude_crc_bytes,
+                encoded_headers,
+                payload,
+                final_crc_bytes,
+            )
+        )
+
+    def encode_headers(self, headers: HEADERS_SERIALIZATION_MAPPING) -> bytes:
+        if isinstance(headers, FrozenHeaders):
+            return self._encode_frozen_headers(headers)
+        return self._encode_headers(headers)
+
+    def _encode_frozen_headers(self, headers: FrozenHeaders) -> bytes:
+        if headers is not self._frozen_headers:
+            self._frozen_headers_encoded = self._encode_headers(headers)
+            self._frozen_headers = headers
+        return self._frozen_headers_encoded
+
+    def _encode_headers(self, headers: HEADERS_SERIALIZATION_MAPPING) -> bytes:
+        parts = []
         for key, val in headers.items():
-            encoded += self._encode_header_key(key)
-            encoded += self._encode_header_val(val)
-        return encoded
+            parts.append(self._encode_header_key(key))
+            parts.append(self._encode_header_val(val))
+        return b"".join(parts)
 
     def _encode_header_key(self, key: str) -> bytes:
-        enc = key.encode("utf-8")
-        return pack("B", len(enc)) + enc
+        encoded_key = self._encoded_header_keys.get(key)
+        if encoded_key is None:
+            enc = key.encode("utf-8")
+            encoded_key = _UINT8_STRUCT.pack(len(enc)) + enc
+            if len(self._encoded_header_keys) < self._MAX_CACHED_HEADER_KEYS:
+                self._encoded_header_keys[key] = encoded_key
+        return encoded_key
 
     def _encode_header_val(self, val: HEADER_SERIALIZATION_VALUE) -> bytes:
-        # Handle booleans first to avoid being viewed as ints
-        if val is True:
-            return b"\x00"
-        elif val is False:
-            return b"\x01"
-
-        if isinstance(val, int):
-            val = self.DEFAULT_INT_TYPE(val)
-
-        if isinstance(val, Int8HeaderValue):
-            return b"\x02" + pack("!b", val.value)
-        elif isinstance(val, Int16HeaderValue):
-            return b"\x03" + pack("!h", val.value)
-        elif isinstance(val, Int32HeaderValue):
-            return b"\x04" + pack("!i", val.value)
-        elif isinstance(val, Int64HeaderValue):
-            return b"\x05" + pack("!q", val.value)
-        elif isinstance(val, bytes):
-            # Byte arrays are prefaced with a 16bit length, but are restricted
-            # to a max length of 2**15 - 1, enforce this explicitly
-            if len(val) > _MAX_HEADER_VALUE_BYTE_LENGTH:
-                raise HeaderValueBytesExceedMaxLength(len(val))
-            return b"\x06" + pack("!H", len(val)) + val
-        elif isinstance(val, str):
-            utf8_string = val.encode("utf-8")
-            # Strings are prefaced with a 16bit length, but are restricted
-            # to a max length of 2**15 - 1, enforce this explicitly
-            if len(utf8_string) > _MAX_HEADER_VALUE_BYTE_LENGTH:
-                raise HeaderValueBytesExceedMaxLength(len(utf8_string))
-            return b"\x07" + pack("!H", len(utf8_string)) + utf8_string
-        elif isinstance(val, datetime.datetime):
+        encoder = self._HEADER_VALUE_ENCODERS.get(type(val))
+        if encoder is None:
+            # Subclasses of the supported types fall back to isinstance checks
+            for value_type, encoder in self._HEADER_VALUE_ENCODERS.items():
+                if isinstance(val, value_type):
+                    break
+            else:
+                raise InvalidHeaderValue(val)
+        return encoder(self, val)
+
+    def _encode_bool(self, val: bool) -> bytes:
+        return b"\x00" if val else b"\x01"
+
+    def _encode_int(self, val: int) -> bytes:
+        return self._encode_header_val(self.DEFAULT_INT_TYPE(val))
+
+    def _encode_int8(self, val: Int8HeaderValue) -> bytes:
+        return b"\x02" + _INT8_STRUCT.pack(val.value)
+
+    def _encode_int16(self, val: Int16HeaderValue) -> bytes:
+        return b"\x03" + _INT16_STRUCT.pack(val.value)
+
+    def _encode_int32(self, val: Int32HeaderValue) -> bytes:
+        return b"\x04" + _INT32_STRUCT.pack(val.value)
+
+    def _encode_int64(self, val: Int64HeaderValue) -> bytes:
+        return b"\x05" + _INT64_STRUCT.pack(val.value)
+
+    def _encode_bytes(self, val: bytes) -> bytes:
+        # Byte arrays are prefaced with a 16bit length, but are restricted
+        # to a max length of 2**15 - 1, enforce this explicitly
+        if len(val) > _MAX_HEADER_VALUE_BYTE_LENGTH:
+            raise HeaderValueBytesExceedMaxLength(len(val))
+        return b"\x06" + _UINT16_STRUCT.pack(len(val)) + val
+
+    def _encode_str(self, val: str) -> bytes:
+        utf8_string = val.encode("utf-8")
+        # Strings are prefaced with a 16bit length, but are restricted
+        # to a max length of 2**15 - 1, enforce this explicitly
+        if len(utf8_string) > _MAX_HEADER_VALUE_BYTE_LENGTH:
+            raise HeaderValueBytesExceedMaxLength(len(utf8_string))
+        return b"\x07" + _UINT16_STRUCT.pack(len(utf8_string)) + utf8_string
+
+    def _encode_timestamp(self, val: datetime.datetime) -> bytes:
+        if val.tzinfo is None:
+            # Naive datetimes are interpreted as local time
             ms_timestamp = int(val.timestamp() * 1000)
-            return b"\x08" + pack("!q", ms_timestamp)
-        elif isinstance(val, uuid.UUID):
-            return b"\x09" + val.bytes
-        raise InvalidHeaderValue(val)
+        else:
+            # Exact integer milliseconds, without a float round trip
+            ms_timestamp = (val - _EPOCH) // _ONE_MILLISECOND
+        return b"\x08" + _INT64_STRUCT.pack(ms_timestamp)
+
+    def _encode_uuid(self, val: uuid.UUID) -> bytes:
+        return b"\x09" + val.bytes
+
+    # Encoders keyed by the exact type of the header value. The order matters
+    # for the isinstance fallback, booleans must be checked before ints.
+    _HEADER_VALUE_ENCODERS: Dict[type, Callable[[Any, Any], bytes]] = {
+        bool: _encode_bool,
+        int: _encode_int,
+        Int8HeaderValue: _encode_int8,
+        Int16HeaderValue: _encode_int16,
+        Int32HeaderValue: _encode_int32,
+        Int64HeaderValue: _encode_int64,
+        bytes: _encode_bytes,
+        str: _encode_str,
+        datetime.datetime: _encode_timestamp,
+        uuid.UUID: _encode_uuid,
+    }
 
     def _encode_prelude(self, encoded_headers: bytes, payload: bytes) -> bytes:
         header_length = len(encoded_headers)
         payload_length = len(payload)
         total_length = header_length + payload_length + 16
-        return pack("!II", total_length, header_length)
+        return _PRELUDE_STRUCT.pack(total_length, header_length)
 
     def _calculate_checksum(self, data: bytes, crc: int = 0) -> int:
         return crc32(data, crc) & 0xFFFFFFFF
@@ -246,11 +385,15 @@ class EventStreamMessageSerializer:
 class BaseEvent:
     """Base class for typed events sent over event stream with service.
 
-    :param payload: bytes payload to be sent with event
+    :param payload: bytes-like payload to be sent with event
     :param event_payload: boolean stating if event has a payload
     """
 
-    def __init__(self, payload: bytes, event_payload: Optional[bool] = None):
+    def __init__(
+        self,
+        payload: Union[bytes, bytearray, memoryview],
+        event_payload: Optional[bool] = None,
+    ):
         self.payload = payload
         self.event_payload = event_payload
         self.event = True
@@ -284,11 +427,39 @@ class BaseStream:
         self._credential_resolver = credential_resolver
 
     async def send_event(self, event: BaseEvent):
-        headers, payload = self._event_serializer.serialize(event)
-        event_bytes = self._eventstream_serializer.serialize(headers, payload)
+        event_bytes = self._serialize_event(event)
         signed_bytes = await self._sign_event(event_bytes)
         self._input_stream.write(signed_bytes)
 
+    async def send_events(self, events: Iterable[BaseEvent]):
+        # Sign every event before writing them to the stream together, so the
+        # request body only has to be woken up once for the whole batch. All
+        # of the events are serialized first so a bad event fails the batch
+        # before any of it is signed.
+        serialized_events = [self._serialize_event(event) for event in events]
+        prior_signature = self._prior_signature
+        signed_events = []
+        try:
+            for event_bytes in serialized_events:
+                signed_events.append(await self._sign_event(event_bytes))
+        except BaseException:
+            # None of the batch was written, the signature chain is rewound so
+            # later events are signed against what the service has received
+            self._prior_signature = prior_signature
+            raise
+        if signed_events:
+            self._input_stream.write(b"".join(signed_events))
+
+    def _serialize_event(self, event: BaseEvent) -> bytes:
+        headers, payload = self._event_serializer.serialize(event)
+        if isinstance(payload, bytes):
+            return self._eventstream_serializer.serialize(headers, payload)
+        # Other buffers are framed through a byte view of our own so they're
+        # only copied once, the view is released even if framing fails so the
+        # caller's buffer isn't left locked against resizing
+        with memoryview(payload) as view, view.cast("B") as payload_view:
+            return self._eventstream_serializer.serialize(headers, payload_view)
+
     async def end_stream(self):
         signed_bytes = await self._sign_event(b"")
         self._input_stream.write(signed_bytes)
@@ -327,6 +498,17 @@ class DecodeUtils:
         4: UINT32_BYTE_FORMAT,
     }
 
+    # The formats are compiled once up front rather than on every unpack
+    _UINT32_STRUCT = Struct(UINT32_BYTE_FORMAT)
+    _INT8_STRUCT = Struct(INT8_BYTE_FORMAT)
+    _INT16_STRUCT = Struct(INT16_BYTE_FORMAT)
+    _INT32_STRUCT = Struct(INT32_BYTE_FORMAT)
+    _INT64_STRUCT = Struct(INT64_BYTE_FORMAT)
+    _PRELUDE_STRUCT = Struct(PRELUDE_BYTE_FORMAT)
+    _UINT_STRUCTS = {
+        size: Struct(uint_format) for size, uint_format in UINT_BYTE_FORMAT.items()
+    }
+
     @staticmethod
     def unpack_true(data: bytes) -> Tuple[bool, int]:
         """This method consumes none of the provided bytes and returns True"""
@@ -340,13 +522,13 @@ class DecodeUtils:
     @staticmethod
     def unpack_uint8(data: bytes) -> Tuple[int, int]:
         """Parse an unsigned 8-bit integer from the bytes."""
-        value = unpack(DecodeUtils.UINT8_BYTE_FORMAT, data[:1])[0]
-        return value, 1
+        # Indexing yields the byte's value directly, skipping struct entirely
+        return data[0], 1
 
     @staticmethod
     def unpack_uint32(data: bytes) -> Tuple[int, int]:
         """Parse an unsigned 32-bit integer from the bytes."""
-        value = unpack(DecodeUtils.UINT32_BYTE_FORMAT, data[:4])[0]
+        value = DecodeUtils._UINT32_STRUCT.unpack_from(data)[0]
         return value, 4
 
     @staticmethod
@@ -359,25 +541,25 @@ class DecodeUtils:
         :rtype: (int, int)
         :returns: A tuple containing the (parsed integer value, bytes consumed)
         """
-        value = unpack(DecodeUtils.INT8_BYTE_FORMAT, data[:1])[0]
+        value = DecodeUtils._INT8_STRUCT.unpack_from(data)[0]
         return value, 1
 
     @staticmethod
     def unpack_int16(data: bytes) -> Tuple[int, int]:
         """Parse a signed 16-bit integer from the bytes."""
-        value = unpack(DecodeUtils.INT16_BYTE_FORMAT, data[:2])[0]
+        value = DecodeUtils._INT16_STRUCT.unpack_from(data)[0]
         return value, 2
 
     @staticmethod
     def unpack_int32(data: bytes) -> Tuple[int, int]:
         """Parse a signed 32-bit integer from the bytes."""
-        value = unpack(DecodeUtils.INT32_BYTE_FORMAT, data[:4])[0]
+        value = DecodeUtils._INT32_STRUCT.unpack_from(data)[0]
         return value, 4
 
     @staticmethod
     def unpack_int64(data: bytes) -> Tuple[int, int]:
         """Parse a signed 64-bit integer from the bytes."""
-        value = unpack(DecodeUtils.INT64_BYTE_FORMAT, data[:8])[0]
+        value = DecodeUtils._INT64_STRUCT.unpack_from(data)[0]
         return value, 8
 
     @staticmethod
@@ -389,10 +571,10 @@ class DecodeUtils:
         where length is an unsigned integer represented in the smallest number
         of bytes to hold the maximum length of the array.
         """
-        uint_byte_format = DecodeUtils.UINT_BYTE_FORMAT[length_byte_size]
-        length = unpack(uint_byte_format, data[:length_byte_size])[0]
+        uint_struct = DecodeUtils._UINT_STRUCTS[length_byte_size]
+        length = uint_struct.unpack_from(data)[0]
         bytes_end = length + length_byte_size
-        array_bytes = data[length_byte_size:bytes_end]
+        array_bytes = bytes(data[length_byte_size:bytes_end])
         return array_bytes, bytes_end
 
     @staticmethod
@@ -411,7 +593,7 @@ class DecodeUtils:
     @staticmethod
     def unpack_uuid(data: bytes) -> Tuple[bytes, int]:
         """Parse a 16-byte uuid from the bytes."""
-        return data[:16], 16
+        return bytes(data[:16]), 16
 
     @staticmethod
     def unpack_prelude(data: bytes) -> Tuple[Tuple[Any, ...], int]:
@@ -421,7 +603,7 @@ class DecodeUtils:
             [total_length][header_length][prelude_crc]
         where each field is an unsigned 32-bit integer.
         """
-        return (unpack(DecodeUtils.PRELUDE_BYTE_FORMAT, data), _PRELUDE_LENGTH)
+        return (DecodeUtils._PRELUDE_STRUCT.unpack_from(data), _PRELUDE_LENGTH)
 
 
 def _validate_checksum(data: bytes, checksum: int, crc=0):
@@ -435,6 +617,8 @@ def _validate_checksum(data: bytes, checksum: int, crc=0):
 class MessagePrelude:
     """Represents the prelude of an event stream message."""
 
+    __slots__ = ("total_length", "headers_length", "crc")
+
     def __init__(self, total_length: int, headers_length: int, crc: int):
         self.total_length = total_length
         self.headers_length = headers_length
@@ -465,6 +649,8 @@ class MessagePrelude:
 class EventStreamMessage:
     """Represents an event stream message."""
 
+    __slots__ = ("prelude", "headers", "payload", "crc")
+
     def __init__(self, prelude, headers, payload, crc):
         self.prelude: MessagePrelude = prelude
         self.headers: Dict = headers
@@ -515,13 +701,34 @@ class EventStreamHeaderParser:
         9: DecodeUtils.unpack_uuid,
     }
 
+    # Header names sent by the service, these are matched directly from the
+    # raw bytes so they don't need to be decoded for every message
+    _KNOWN_HEADER_NAMES: Dict[bytes, str] = {
+        name.encode("utf-8"): sys.intern(name)
+        for name in (
+            ":message-type",
+            ":event-type",
+            ":content-type",
+            ":exception-type",
+            ":error-code",
+            ":error-message",
+            ":date",
+            ":chunk-signature",
+        )
+    }
+
     def __init__(self):
         self._data = None
 
     def parse(self, data: bytes) -> Dict[str, HEADER_VALUE]:
         """Parses the event stream headers from an event stream message."""
-        self._data = data
-        return self._parse_headers()
+        # Headers are read through a view so advancing past each one doesn't
+        # copy the remaining header bytes
+        self._data = memoryview(data)
+        try:
+            return self._parse_headers()
+        finally:
+            self._data = None
 
     def _parse_headers(self) -> Dict[str, HEADER_VALUE]:
         headers = {}
@@ -538,8 +745,13 @@ class EventStreamHeaderParser:
         return name, value
 
     def _parse_name(self) -> str:
-        name, consumed = DecodeUtils.unpack_utf8_string(self._data, 1)
+        name_bytes, consumed = DecodeUtils.unpack_byte_array(self._data, 1)
         self._advance_data(consumed)
+        name = self._KNOWN_HEADER_NAMES.get(name_bytes)
+        if name is None:
+            # The same few header names are repeated in every message, interning
+            # them shares one string across messages and speeds up dict lookups
+            name = sys.intern(name_bytes.decode("utf-8"))
         return name
 
     def _parse_type(self) -> int:
@@ -549,6 +761,9 @@ class EventStreamHeaderParser:
 
     def _parse_value(self) -> HEADER_VALUE:
         header_type = self._parse_type()
+        if header_type < 2:
+            # Booleans are held entirely in the type byte, 0 is true, 1 false
+            return header_type == 0
         value_unpacker = self._HEADER_TYPE_MAP[header_type]
         value, consumed = value_unpacker(self._data)
         self._advance_data(consumed)
@@ -565,13 +780,25 @@ class EventStreamBuffer:
     messages as they become available via an iterable interface.
     """
 
+    # Parsed messages are only dropped from the front of the buffer once
+    # this many bytes have been consumed, or the buffer has been drained
+    _COMPACTION_THRESHOLD = 64 * 1024
+
     def __init__(self):
-        self._data: bytes = b""
+        self._data = bytearray()
+        # Offset of the start of the next message within _data
+        self._offset = 0
         self._prelude = None
         self._header_parser = EventStreamHeaderParser()
 
     def add_data(self, data: bytes):
         """Add data to the buffer."""
+        offset = self._offset
+        if offset and (
+            offset >= self._COMPACTION_THRESHOLD or offset == len(self._data)
+        ):
+            del self._data[:offset]
+            self._offset = 0
         self._data += data
 
     def _validate_prelude(self, prelude: MessagePrelude):
@@ -581,39 +808,46 @@ class EventStreamBuffer:
         if prelude.payload_length > _MAX_PAYLOAD_LENGTH:
             raise InvalidPayloadLength(prelude.payload_length)
 
+    def _message_bytes(self, start: int, end: int) -> bytes:
+        # Copies a range of the current message, offsets are relative to the
+        # start of the message and the view avoids an intermediate copy
+        with memoryview(self._data) as data:
+            return data[self._offset + start : self._offset + end].tobytes()
+
     def _parse_prelude(self) -> MessagePrelude:
-        prelude_bytes = self._data[:_PRELUDE_LENGTH]
-        raw_prelude, _ = DecodeUtils.unpack_prelude(prelude_bytes)
+        # The prelude is unpacked and checksummed in place in the buffer
+        offset = self._offset
+        raw_prelude = DecodeUtils._PRELUDE_STRUCT.unpack_from(self._data, offset)
         prelude = MessagePrelude(*raw_prelude)
         self._validate_prelude(prelude)
         # The minus 4 removes the prelude crc from the bytes to be checked
-        _validate_checksum(prelude_bytes[: _PRELUDE_LENGTH - 4], prelude.crc)
+        end = offset + _PRELUDE_LENGTH - 4
+        with memoryview(self._data) as data, data[offset:end] as prelude_bytes:
+            _validate_checksum(prelude_bytes, prelude.crc)
         return prelude
 
     def _parse_headers(self) -> Dict[str, str]:
-        header_bytes = self._data[_PRELUDE_LENGTH : self._prelude.headers_end]
+        header_bytes = self._message_bytes(_PRELUDE_LENGTH, self._prelude.headers_end)
         return self._header_parser.parse(header_bytes)
 
     def _parse_payload(self) -> bytes:
+        # The payload is copied out as the buffer is compacted and reused once
+        # the message has been consumed, a view into it would not stay valid
         prelude = self._prelude
-        payload_bytes = self._data[prelude.headers_end : prelude.payload_end]
-        return payload_bytes
+        return self._message_bytes(prelude.headers_end, prelude.payload_end)
 
     def _parse_message_crc(self) -> int:
-        prelude = self._prelude
-        crc_bytes = self._data[prelude.payload_end : prelude.total_length]
-        message_crc, _ = DecodeUtils.unpack_uint32(crc_bytes)
-        return message_crc
-
-    def _parse_message_bytes(self) -> bytes:
-        # The minus 4 includes the prelude crc to the bytes to be checked
-        message_bytes = self._data[_PRELUDE_LENGTH - 4 : self._prelude.payload_end]
-        return message_bytes
+        crc_offset = self._offset + self._prelude.payload_end
+        return DecodeUtils._UINT32_STRUCT.unpack_from(self._data, crc_offset)[0]
 
     def _validate_message_crc(self) -> int:
         message_crc = self._parse_message_crc()
-        message_bytes = self._parse_message_bytes()
-        _validate_checksum(message_bytes, message_crc, crc=self._prelude.crc)
+        # The minus 4 includes the prelude crc to the bytes to be checked, a
+        # view is used as the bytes are only needed to compute the checksum
+        start = self._offset + _PRELUDE_LENGTH - 4
+        end = self._offset + self._prelude.payload_end
+        with memoryview(self._data) as data, data[start:end] as message_bytes:
+            _validate_checksum(message_bytes, message_crc, crc=self._prelude.crc)
         return message_crc
 
     def _parse_message(self) -> EventStreamMessage:
@@ -625,19 +859,20 @@ class EventStreamBuffer:
         return message
 
     def _prepare_for_next_message(self):
-        # Advance the data and reset the current prelude
-        self._data = self._data[self._prelude.total_length :]
+        # Advance past the current message and reset the current prelude
+        self._offset += self._prelude.total_length
         self._prelude = None
 
     def next(self) -> EventStreamMessage:
         """Provides the next available message parsed from the stream"""
-        if len(self._data) < _PRELUDE_LENGTH:
+        available = len(self._data) - self._offset
+        if available < _PRELUDE_LENGTH:
             raise StopIteration()
 
         if self._prelude is None:
             self._prelude = self._parse_prelude()
 
-        if len(self._data) < self._prelude.total_length:
+        if available < self._prelude.total_length:
             raise StopIteration()
 
         return self._parse_message()
@@ -694,9 +929,12 @@ class EventSigner:
         if utc_now is None:
             utc_now = _utc_now
         self._utc_now = utc_now
+        # The keyed HMAC for the most recently derived signing key along
+        # with the (secret key, date) it was derived from
+        self._signing_hmac: Optional[Tuple[Tuple[str, bytes], hmac.HMAC]] = None
 
     def sign(
-        self, payload: bytes, prior_signature: bytes, credentials: Credentials
+        self, payload: bytes, prior_signature: bytes, credentials: "Credentials"
     ) -> HEADERS_SERIALIZATION_DICT:
         now = self._utc_now()
         headers: HEADERS_SERIALIZATION_DICT = {
@@ -725,28 +963,44 @@ class EventSigner:
         headers: HEADERS_SERIALIZATION_DICT,
         payload: bytes,
         prior_signature: bytes,
-    ) -> str:
+    ) -> bytes:
         encoded_headers = self.serializer.encode_headers(headers)
-        parts = [
-            "AWS4-HMAC-SHA256-PAYLOAD",
-            timestamp,
-            self._keypath(timestamp),
-            hexlify(prior_signature).decode("utf-8"),
-            sha256(encoded_headers).hexdigest(),
-            sha256(payload).hexdigest(),
-        ]
-        return "\n".join(parts)
+        # The string to sign is assembled directly as bytes so the parts
+        # don't need to be decoded and then encoded again for signing
+        parts = (
+            b"AWS4-HMAC-SHA256-PAYLOAD",
+            timestamp.encode("utf-8"),
+            self._keypath(timestamp).encode("utf-8"),
+            hexlify(prior_signature),
+            hexlify(sha256(encoded_headers).digest()),
+            hexlify(sha256(payload).digest()),
+        )
+        return b"\n".join(parts)
 
     def _hmac(self, key: bytes, msg: bytes) -> bytes:
         return hmac.new(key, msg, sha256).digest()
 
-    def _sign_event(
-        self, timestamp: str, string_to_sign: str, credentials: Credentials
-    ) -> bytes:
+    def _get_signing_hmac(self, today: bytes, credentials: "Credentials") -> hmac.HMAC:
+        # Deriving the signing key takes four HMAC operations, but the key only
+        # changes with the date or credentials so it's reused across events
+        cache_key = (credentials.secret_access_key, today)
+        cached = self._signing_hmac
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
         key = credentials.secret_access_key.encode("utf-8")
-        today = timestamp[:8].encode("utf-8")  # Only using the YYYYMMDD
         k_date = self._hmac(b"AWS4" + key, today)
         k_region = self._hmac(k_date, self.region.encode("utf-8"))
         k_service = self._hmac(k_region, self.signing_name.encode("utf-8"))
         k_signing = self._hmac(k_service, b"aws4_request")
-        return self._hmac(k_signing, string_to_sign.encode("utf-8"))
+        signing_hmac = hmac.new(k_signing, digestmod=sha256)
+        self._signing_hmac = (cache_key, signing_hmac)
+        return signing_hmac
+
+    def _sign_event(
+        self, timestamp: str, string_to_sign: bytes, credentials: "Credentials"
+    ) -> bytes:
+        today = timestamp[:8].encode("utf-8")  # Only using the YYYYMMDD
+        # Copying the keyed HMAC skips rehashing the key for every event
+        event_hmac = self._get_signing_hmac(today, credentials).copy()
+        event_hmac.update(string_to_sign)
+        return event_hmac.digest()
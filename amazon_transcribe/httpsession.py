@@ -14,12 +14,13 @@
 
 import asyncio
 
+from collections import deque
 from io import BytesIO
 from threading import Lock
 from urllib.parse import urlparse, ParseResult
 from awscrt import io, http
 from concurrent.futures import Future
-from typing import Optional, List, Tuple, Union, Awaitable, AsyncGenerator
+from typing import Deque, Optional, List, Tuple, Union, Awaitable, AsyncGenerator
 
 from amazon_transcribe.exceptions import HTTPException
 from amazon_transcribe.response import Response
@@ -32,8 +33,8 @@ class AwsCrtHttpResponse:
         self._stream = None
         self._status_code_future: Future[int] = Future()
         self._headers_future: Future[HeadersList] = Future()
-        self._chunk_futures: List[Future[bytes]] = []
-        self._received_chunks: List[bytes] = []
+        self._chunk_futures: Deque[Future[bytes]] = deque()
+        self._received_chunks: Deque[bytes] = deque()
         self._chunk_lock: Lock = Lock()
 
     async def resolve_response(self) -> Response:
@@ -69,17 +70,23 @@ class AwsCrtHttpResponse:
 
     def get_chunk(self) -> Awaitable[bytes]:
         with self._chunk_lock:
-            future: Future[bytes] = Future()
             # TODO: update backpressure window
             if self._received_chunks:
-                chunk = self._received_chunks.pop(0)
-                future.set_result(chunk)
+                return self._resolved_chunk(self._received_chunks.popleft())
             elif self._stream.completion_future.done():
-                future.set_result(b"")
-            else:
-                self._chunk_futures.append(future)
+                return self._resolved_chunk(b"")
+            future: Future[bytes] = Future()
+            self._chunk_futures.append(future)
             return asyncio.wrap_future(future)
 
+    def _resolved_chunk(self, chunk: bytes) -> Awaitable[bytes]:
+        # Chunks that have already been received don't need to be handed off
+        # from the CRT thread, so resolve them directly on the running loop
+        # rather than round tripping through a concurrent Future.
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(chunk)
+        return future
+
     async def chunks(self) -> AsyncGenerator[bytes, None]:
         while True:
             chunk = await self.get_chunk()
@@ -96,7 +103,7 @@ class AwsCrtHttpResponse:
         with self._chunk_lock:
             # TODO: update back pressure window
             if self._chunk_futures:
-                future = self._chunk_futures.pop(0)
+                future = self._chunk_futures.popleft()
                 future.set_result(chunk)
             else:
                 self._received_chunks.append(chunk)
@@ -104,7 +111,7 @@ class AwsCrtHttpResponse:
     def _on_complete(self, completion_future):
         with self._chunk_lock:
             if self._chunk_futures:
-                future = self._chunk_futures.pop(0)
+                future = self._chunk_futures.popleft()
                 future.set_result(b"")
 
 
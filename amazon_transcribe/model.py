@@ -11,10 +11,13 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
-from typing import Optional, List
+import asyncio
+from typing import Iterable, Optional, List, Union
 
 from amazon_transcribe.eventstream import BaseEvent, BaseStream, EventStream
 
+AUDIO_CHUNK = Union[bytes, bytearray, memoryview]
+
 
 class Alternative:
     """A list of possible transcriptions for the audio.
@@ -23,6 +26,8 @@ class Alternative:
     :param items: One or more alternative interpretations of the input audio.
     """
 
+    __slots__ = ("transcript", "items")
+
     def __init__(self, transcript, items):
         self.transcript: str = transcript
         self.items: List[Item] = items
@@ -36,7 +41,7 @@ class AudioEvent(BaseEvent):
         of one or more audio events. The maximum audio chunk size is 32 KB.
     """
 
-    def __init__(self, audio_chunk: Optional[bytes]):
+    def __init__(self, audio_chunk: Optional[AUDIO_CHUNK]):
         if audio_chunk is None:
             audio_chunk = b""
         super().__init__(payload=audio_chunk)
@@ -53,14 +58,118 @@ class AudioStream(BaseStream):
     from the client within a relevant wrapper object.
     """
 
-    async def send_audio_event(self, audio_chunk: Optional[bytes]):
+    # Audio events are limited to 32 KB of audio
+    _MAX_BATCH_BYTES = 32 * 1024
+    # Maximum time in seconds a chunk is held back waiting for more audio
+    _BATCH_WINDOW = 0.02
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending_chunks: List[bytes] = []
+        self._pending_bytes = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Future] = None
+        # Created lazily so it's bound to the loop the stream is used on
+        self._send_lock: Optional[asyncio.Lock] = None
+
+    async def send_audio_event(
+        self, audio_chunk: Optional[AUDIO_CHUNK], flush_immediately: bool = True
+    ):
         """Enqueue audio bytes to be sent for transcription.
 
         :param audio_chunk: byte-string chunk of audio input.
             The maximum audio chunk size is 32 KB.
+        :param flush_immediately:
+            When False, the chunk may be held back for up to 20 ms and sent
+            along with the chunks that follow it as a single audio event.
+            This reduces the number of events that need to be signed when
+            audio is produced in many small chunks. Empty chunks are always
+            sent right away, after any audio being held back.
         """
-        audio_event = AudioEvent(audio_chunk)
-        await super().send_event(audio_event)
+        await self._wait_for_flush_task()
+        if audio_chunk and (self._pending_chunks or not flush_immediately):
+            if self._pending_bytes + len(audio_chunk) > self._MAX_BATCH_BYTES:
+                await self.flush()
+            self._pending_chunks.append(bytes(audio_chunk))
+            self._pending_bytes += len(audio_chunk)
+            if flush_immediately or self._pending_bytes >= self._MAX_BATCH_BYTES:
+                async with self._get_send_lock():
+                    await self._send_pending()
+            elif self._flush_handle is None:
+                loop = asyncio.get_running_loop()
+                self._flush_handle = loop.call_later(
+                    self._BATCH_WINDOW, self._schedule_flush
+                )
+            return
+        # Unbatched chunks are sent right away. This includes empty chunks,
+        # which callers may use to mark the end of their audio.
+        async with self._get_send_lock():
+            await self._send_pending()
+            await super().send_event(AudioEvent(audio_chunk))
+
+    async def send_audio_event_many(
+        self, audio_chunks: Iterable[Optional[AUDIO_CHUNK]]
+    ):
+        """Send several audio chunks, each as its own audio event.
+
+        All of the events are signed before being written to the request
+        together, which is cheaper than awaiting send_audio_event per chunk
+        when the audio is already available, e.g. when read from a file.
+
+        :param audio_chunks: byte-string chunks of audio input.
+            The maximum audio chunk size is 32 KB.
+        """
+        await self._wait_for_flush_task()
+        async with self._get_send_lock():
+            await self._send_pending()
+            await super().send_events(AudioEvent(chunk) for chunk in audio_chunks)
+
+    async def flush(self):
+        """Send any audio chunks that are being held back as one audio event."""
+        await self._wait_for_flush_task()
+        async with self._get_send_lock():
+            await self._send_pending()
+
+    async def end_stream(self):
+        await self.flush()
+        async with self._get_send_lock():
+            await super().end_stream()
+
+    async def _send_pending(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending_chunks:
+            return
+        sent_chunks = len(self._pending_chunks)
+        audio_chunk = b"".join(self._pending_chunks)
+        await super().send_event(AudioEvent(audio_chunk))
+        # Only drop the audio once it's been sent, a failed send leaves it
+        # pending for the next flush
+        del self._pending_chunks[:sent_chunks]
+        self._pending_bytes -= len(audio_chunk)
+
+    async def _flush_in_background(self):
+        async with self._get_send_lock():
+            await self._send_pending()
+
+    def _schedule_flush(self):
+        self._flush_handle = None
+        self._flush_task = asyncio.ensure_future(self._flush_in_background())
+
+    async def _wait_for_flush_task(self):
+        # Wait on any flush started by the batch window timer so its errors
+        # are raised to the caller rather than lost with the task
+        flush_task, self._flush_task = self._flush_task, None
+        if flush_task is not None:
+            await flush_task
+
+    def _get_send_lock(self) -> asyncio.Lock:
+        # Events are signed in a chain, the lock keeps them in the order
+        # their audio was sent when a flush is running in the background
+        if self._send_lock is None:
+            self._send_lock = asyncio.Lock()
+        return self._send_lock
 
 
 class Item:
@@ -98,6 +207,18 @@ class Item:
        the result is stable.
     """
 
+    # Results can carry many items, slots keep each one small
+    __slots__ = (
+        "start_time",
+        "end_time",
+        "item_type",
+        "content",
+        "vocabulary_filter_match",
+        "speaker",
+        "confidence",
+        "stable",
+    )
+
     def __init__(
         self,
         start_time: Optional[float] = None,
@@ -150,6 +271,15 @@ class Result:
         audio stream.
     """
 
+    __slots__ = (
+        "result_id",
+        "start_time",
+        "end_time",
+        "is_partial",
+        "alternatives",
+        "channel_id",
+    )
+
     def __init__(
         self,
         result_id: Optional[str] = None,
@@ -363,6 +493,8 @@ class Transcript:
         input audio stream. The array can be empty.
     """
 
+    __slots__ = ("results",)
+
     def __init__(self, results: List[Result]):
         self.results = results
 
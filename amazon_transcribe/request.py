@@ -14,7 +14,7 @@
 
 from collections.abc import MutableMapping
 from io import BufferedIOBase, BytesIO
-from typing import Dict, List, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from amazon_transcribe.exceptions import ValidationException
 
@@ -24,73 +24,87 @@ HEADER_VALUE_TYPE = Union[str, LIST_TYPE]
 BODY_TYPE = Union[BytesIO, BufferedIOBase]
 
 
-class _HeaderKey:
-    def __init__(self, key: str):
-        self._key = key
-        self._lower = key.lower()
-
-    def __hash__(self):
-        return hash(self._lower)
-
-    def __eq__(self, other):
-        return isinstance(other, _HeaderKey) and self._lower == other._lower
-
-    def __str__(self):
-        return self._key
-
-    def __repr__(self):
-        return repr(self._key)
-
-
 class HeadersDict(MutableMapping):
     """A case-insenseitive dictionary to represent HTTP headers."""
 
+    __slots__ = ("_dict",)
+
+    # Deletes carriage returns and line feeds in a single pass
+    _NEWLINE_TABLE = str.maketrans("", "", "\r\n")
+
     def __init__(self, *args, **kwargs):
-        self._dict: Dict = {}
+        # Maps the lowercased header name to the (name, value) pair, names
+        # keep the casing they were first set with
+        self._dict: Dict[str, Tuple[str, Optional[str]]] = {}
         self.update(*args, **kwargs)
 
     def __setitem__(self, key: str, value: HEADER_VALUE_TYPE):
-        key, value = self._validate_header(key, value)
-        self._dict[_HeaderKey(key)] = value
+        key, header_value = self._validate_header(key, value)
+        lower_key = key.lower()
+        existing = self._dict.get(lower_key)
+        if existing is not None:
+            key = existing[0]
+        self._dict[lower_key] = (key, header_value)
 
     def __getitem__(self, key: str):
-        return self._dict[_HeaderKey(key)]
+        return self._dict[key.lower()][1]
 
     def __delitem__(self, key: str):
-        del self._dict[_HeaderKey(key)]
+        del self._dict[key.lower()]
+
+    def __contains__(self, key):
+        return isinstance(key, str) and key.lower() in self._dict
 
     def __iter__(self):
-        return (str(key) for key in self._dict)
+        return (key for key, _ in self._dict.values())
 
     def __len__(self):
         return len(self._dict)
 
     def __repr__(self):
-        return repr(self._dict)
+        return repr(dict(self._dict.values()))
 
     def copy(self) -> "HeadersDict":
-        return HeadersDict(self.items())
+        # The headers have already been validated, only the mapping is copied
+        headers = HeadersDict()
+        headers._dict = self._dict.copy()
+        return headers
+
+    @classmethod
+    def _from_validated(cls, headers: Iterable[Tuple[str, str]]) -> "HeadersDict":
+        """Creates a HeadersDict from headers known to be validated already.
+
+        Used for headers that were produced from a prepared request, such as
+        the signed headers, which don't need to be sanitized again.
+        """
+        headers_dict = cls()
+        entries = headers_dict._dict
+        for key, value in headers:
+            lower_key = key.lower()
+            existing = entries.get(lower_key)
+            if existing is not None:
+                key = existing[0]
+            entries[lower_key] = (key, value)
+        return headers_dict
 
     def as_list(self) -> List[Tuple[str, str]]:
-        return [(str(k), v) for k, v in self._dict.items() if v is not None]
+        return [(k, v) for k, v in self._dict.values() if v is not None]
 
     def _validate_str(self, string: str) -> str:
         if string is None:
             return string
         # newline characters are prohibited in headers
-        for seq in ("\r\n", "\r", "\n"):
-            string = string.replace(seq, "")
-        return string.strip(" ")
+        return string.translate(self._NEWLINE_TABLE).strip(" ")
 
     def _validate_header_list(
         self, key: str, values: LIST_TYPE
-    ) -> Tuple[str, HEADER_VALUE_TYPE]:
+    ) -> Tuple[str, Optional[str]]:
         value_list = [self._validate_str(v) for v in values if v is not None]
         return self._validate_str(key), ";".join(value_list)
 
     def _validate_header(
         self, key: str, value: HEADER_VALUE_TYPE
-    ) -> Tuple[str, HEADER_VALUE_TYPE]:
+    ) -> Tuple[str, Optional[str]]:
         if key is None:
             raise ValidationException("Unexpected key (None) was provided in headers")
         if isinstance(value, (tuple, list)):
@@ -131,6 +145,8 @@ class Request:
 
     def prepare_params(self) -> str:
         """Converts dictionary of params into query string"""
+        if not self.params:
+            return ""
         query_list = []
         for k, v in self.params.items():
             if v is None:
@@ -142,6 +158,9 @@ class Request:
         return "&".join(query_list)
 
     def prepare_headers(self) -> HeadersDict:
+        if isinstance(self.headers, HeadersDict):
+            # Already validated, the entries can be copied over as they are
+            return self.headers.copy()
         prepared_headers = HeadersDict()
         prepared_headers.update(self.headers)
         return prepared_headers
@@ -153,6 +172,8 @@ class Request:
         elif isinstance(body, str):
             return BytesIO(body.encode("utf-8"))
         elif isinstance(body, bytes):
+            # BytesIO shares the initial bytes object rather than copying it
+            # until the stream is written to, so this wrapping is zero-copy
             return BytesIO(body)
         elif not isinstance(body, BufferedIOBase):
             type_ = type(body)
@@ -177,7 +198,6 @@ class PreparedRequest:
     def uri(self) -> str:
         endpoint = self.endpoint.rstrip("/")
         path = self.path.lstrip("/")
-        output_uri = "/".join([endpoint, path])
         if self.query:
-            output_uri = "?".join([output_uri, self.query])
-        return output_uri
+            return f"{endpoint}/{path}?{self.query}"
+        return f"{endpoint}/{path}"
@@ -12,8 +12,9 @@
 # language governing permissions and limitations under the License.
 
 
-from typing import Any, Dict, Tuple, Optional
+from typing import Dict, Mapping, Tuple
 
+from amazon_transcribe.eventstream import FrozenHeaders
 from amazon_transcribe.request import Request
 from amazon_transcribe.structures import BufferableByteStream
 from amazon_transcribe.utils import _add_required_headers
@@ -30,31 +31,31 @@ class TranscribeStreamingSerializer:
     Request object for streaming to the Transcribe service.
     """
 
-    def _serialize_header(
-        self,
-        header: str,
-        value: Any,
-        prefix: str = "x-amzn-transcribe-",
-    ) -> Dict[str, str]:
-        if value is None:
-            return {}
-        else:
-            return {f"{prefix}{header}": str(value)}
-
-    def _serialize_str_header(
-        self, header: str, value: Optional[str]
-    ) -> Dict[str, str]:
-        return self._serialize_header(header, value)
-
-    def _serialize_int_header(
-        self, header: str, value: Optional[int]
-    ) -> Dict[str, str]:
-        return self._serialize_header(header, value)
-
-    def _serialize_bool_header(
-        self, header: str, value: Optional[bool]
-    ) -> Dict[str, str]:
-        return self._serialize_header(header, value)
+    # Maps each serialized header to its attribute on the request shape
+    _START_STREAM_TRANSCRIPTION_HEADERS: Tuple[Tuple[str, str], ...] = (
+        ("x-amzn-transcribe-language-code", "language_code"),
+        ("x-amzn-transcribe-sample-rate", "media_sample_rate_hz"),
+        ("x-amzn-transcribe-media-encoding", "media_encoding"),
+        ("x-amzn-transcribe-vocabulary-name", "vocabulary_name"),
+        ("x-amzn-transcribe-session-id", "session_id"),
+        ("x-amzn-transcribe-vocabulary-filter-method", "vocab_filter_method"),
+        ("x-amzn-transcribe-vocabulary-filter-name", "vocab_filter_name"),
+        ("x-amzn-transcribe-show-speaker-label", "show_speaker_label"),
+        (
+            "x-amzn-transcribe-enable-channel-identification",
+            "enable_channel_identification",
+        ),
+        ("x-amzn-transcribe-number-of-channels", "number_of_channels"),
+        (
+            "x-amzn-transcribe-enable-partial-results-stabilization",
+            "enable_partial_results_stabilization",
+        ),
+        (
+            "x-amzn-transcribe-partial-results-stability",
+            "partial_results_stability",
+        ),
+        ("x-amzn-transcribe-language-model-name", "language_model_name"),
+    )
 
     def serialize_start_stream_transcription_request(
         self, endpoint: str, request_shape: StartStreamTranscriptionRequest
@@ -64,71 +65,10 @@ class TranscribeStreamingSerializer:
         request_uri = "/stream-transcription"
 
         headers: Dict[str, str] = {}
-        headers.update(
-            self._serialize_str_header("language-code", request_shape.language_code)
-        )
-        headers.update(
-            self._serialize_int_header(
-                "sample-rate", request_shape.media_sample_rate_hz
-            )
-        )
-        headers.update(
-            self._serialize_str_header("media-encoding", request_shape.media_encoding)
-        )
-        headers.update(
-            self._serialize_str_header("vocabulary-name", request_shape.vocabulary_name)
-        )
-        headers.update(
-            self._serialize_str_header("session-id", request_shape.session_id)
-        )
-        headers.update(
-            self._serialize_str_header(
-                "vocabulary-filter-method",
-                request_shape.vocab_filter_method,
-            )
-        )
-        headers.update(
-            self._serialize_str_header(
-                "vocabulary-filter-name",
-                request_shape.vocab_filter_name,
-            )
-        )
-        headers.update(
-            self._serialize_bool_header(
-                "show-speaker-label",
-                request_shape.show_speaker_label,
-            )
-        )
-        headers.update(
-            self._serialize_bool_header(
-                "enable-channel-identification",
-                request_shape.enable_channel_identification,
-            )
-        )
-        headers.update(
-            self._serialize_int_header(
-                "number-of-channels",
-                request_shape.number_of_channels,
-            )
-        )
-        headers.update(
-            self._serialize_bool_header(
-                "enable-partial-results-stabilization",
-                request_shape.enable_partial_results_stabilization,
-            )
-        )
-        headers.update(
-            self._serialize_str_header(
-                "partial-results-stability",
-                request_shape.partial_results_stability,
-            )
-        )
-        headers.update(
-            self._serialize_str_header(
-                "language-model-name",
-                request_shape.language_model_name,
-            )
-        )
+        for header, attr in self._START_STREAM_TRANSCRIPTION_HEADERS:
+            value = getattr(request_shape, attr)
+            if value is not None:
+                headers[header] = str(value)
 
         _add_required_headers(endpoint, headers)
 
@@ -144,7 +84,17 @@ class TranscribeStreamingSerializer:
         return request
 
 
-SERIALIZED_EVENT = Tuple[Dict, bytes]
+SERIALIZED_EVENT = Tuple[Mapping, bytes]
+
+# Headers are identical for every audio event, these frozen headers are
+# shared across events so its encoding can be reused by the serializer
+_AUDIO_EVENT_HEADERS: FrozenHeaders = FrozenHeaders(
+    {
+        ":message-type": "event",
+        ":event-type": "AudioEvent",
+        ":content-type": "application/octet-stream",
+    }
+)
 
 
 class EventSerializer:
@@ -161,9 +111,6 @@ class AudioEventSerializer(EventSerializer):
         raise SerializerException(f'Unexpected event type encountered: "{type(event)}"')
 
     def _serialize_audio_event(self, audio_event: AudioEvent):
-        headers = {
-            ":message-type": "event",
-            ":event-type": "AudioEvent",
-            ":content-type": "application/octet-stream",
-        }
-        return headers, audio_event.payload
+        # The chunk is passed through as is, it's only copied once when the
+        # outgoing message is assembled
+        return _AUDIO_EVENT_HEADERS, audio_event.payload
@@ -12,7 +12,9 @@
 # language governing permissions and limitations under the License.
 
 
-from typing import Optional
+import asyncio
+from concurrent.futures import Future
+from typing import Optional, Tuple
 
 from awscrt.http import HttpHeaders, HttpRequest
 from awscrt.auth import (
@@ -37,21 +39,37 @@ class RequestSigner:
         self.region: str = region
         self.algorithm: int = algorithm
         self.signature_type: int = signature_type
+        # The static CRT credentials provider for the most recently used
+        # credentials, along with the credentials it was created from
+        self._credentials_provider: Optional[
+            Tuple[Tuple[str, str, Optional[str]], AwsCredentialsProvider]
+        ] = None
 
     def sign(
         self, request: PreparedRequest, credentials: Optional[Credentials]
     ) -> PreparedRequest:
+        future = self._start_signing(request, credentials)
+        return self._apply_signed_headers(request, future.result())
+
+    async def sign_async(
+        self, request: PreparedRequest, credentials: Optional[Credentials]
+    ) -> PreparedRequest:
+        """Signs the request without blocking the event loop on the CRT."""
+        future = self._start_signing(request, credentials)
+        signed_request = await asyncio.wrap_future(future)
+        return self._apply_signed_headers(request, signed_request)
+
+    def _start_signing(
+        self, request: PreparedRequest, credentials: Optional[Credentials]
+    ) -> "Future[HttpRequest]":
         if credentials is None:
             raise CredentialsException("Failed to resolve credentials")
         alg = AwsSigningAlgorithm(self.algorithm)
         sig_type = AwsSignatureType(self.signature_type)
 
-        credential_provider = AwsCredentialsProvider.new_static(
-            credentials.access_key_id,
-            credentials.secret_access_key,
-            credentials.session_token,
-        )
+        credential_provider = self._get_credentials_provider(credentials)
 
+        # The config is built for every request as it captures the signing date
         config = AwsSigningConfig(
             algorithm=alg,
             signature_type=sig_type,
@@ -61,12 +79,36 @@ class RequestSigner:
             signed_body_value=AwsSignedBodyValue.EMPTY_SHA256,
             signed_body_header_type=AwsSignedBodyHeaderType.NONE,
         )
-        crt_request = _convert_request(request)
-        signed_request = aws_sign_request(crt_request, config).result()
-        request.headers = HeadersDict(dict(signed_request.headers))
+        # The body is signed as EMPTY_SHA256 so the CRT never reads it, it's
+        # left off the request rather than wrapped in a native input stream
+        crt_request = _convert_request(request, include_body=False)
+        return aws_sign_request(crt_request, config)
 
+    def _apply_signed_headers(
+        self, request: PreparedRequest, signed_request: HttpRequest
+    ) -> PreparedRequest:
+        # The signed headers are the prepared headers plus the ones added by
+        # the signer, none of which need to be validated again
+        request.headers = HeadersDict._from_validated(signed_request.headers)
         return request
 
+    def _get_credentials_provider(
+        self, credentials: Credentials
+    ) -> AwsCredentialsProvider:
+        # Credentials rarely change between requests, the native provider is
+        # only recreated when they do
+        key = (
+            credentials.access_key_id,
+            credentials.secret_access_key,
+            credentials.session_token,
+        )
+        cached = self._credentials_provider
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        credential_provider = AwsCredentialsProvider.new_static(*key)
+        self._credentials_provider = (key, credential_provider)
+        return credential_provider
+
 
 class SigV4RequestSigner(RequestSigner):
     def __init__(self, service_name, region):
@@ -75,10 +117,12 @@ class SigV4RequestSigner(RequestSigner):
         self.signature_type: int = AwsSignatureType.HTTP_REQUEST_HEADERS
 
 
-def _convert_request(request: PreparedRequest) -> HttpRequest:
+def _convert_request(
+    request: PreparedRequest, include_body: bool = True
+) -> HttpRequest:
     return HttpRequest(
         method=request.method,
         path=request.path,
         headers=HttpHeaders(request.headers.as_list()),
-        body_stream=request.body,
+        body_stream=request.body if include_body else None,
     )
@@ -12,8 +12,9 @@
 # language governing permissions and limitations under the License.
 
 
+from collections import deque
 from io import BufferedIOBase
-from typing import Optional, TYPE_CHECKING
+from typing import Deque, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # We need to import this from _typeshed as this is not publicly exposed and
@@ -25,31 +26,27 @@ if TYPE_CHECKING:
 class BufferableByteStream(BufferedIOBase):
     """BufferableByteStream will always be in non-blocking mode"""
 
+    # Consumed bytes are only compacted out of the buffer once they exceed
+    # this size and make up more than half of the buffer
+    _COMPACTION_THRESHOLD = 64 * 1024
+
     def __init__(self):
-        self._byte_chunks: list = []
+        self._buffer: bytearray = bytearray()
+        self._read_pos: int = 0
+        # Number of bytes that have been compacted out of the buffer
+        self._offset: int = 0
+        # Stream offsets where each written chunk ends, reads never span
+        # across the boundary between two written chunks
+        self._chunk_ends: Deque[int] = deque()
         self.__done: bool = False
         self.__closed: bool = False
 
     def read(self, size=-1) -> Optional[bytes]:  # type: ignore
-        if len(self._byte_chunks) < 1 and not self.__done:
-            raise BlockingIOError("read")
-        elif (self.__done and not self._byte_chunks) or self.closed:
-            return b""
-
-        temp_bytes = self._byte_chunks.pop(0)
-        remaining_bytes = b""
-        if size == -1:
-            return temp_bytes
-        elif size > 0:
-            remaining_bytes = temp_bytes[size:]
-            temp_bytes = temp_bytes[:size]
-        else:
-            remaining_bytes = temp_bytes
-            temp_bytes = b""
-
-        if len(remaining_bytes) > 0:
-            self._byte_chunks.insert(0, remaining_bytes)
-        return temp_bytes
+        start, end = self._next_read(size)
+        with memoryview(self._buffer) as view:
+            data = view[start:end].tobytes()
+        self._consume(end)
+        return data
 
     def read1(self, size=-1) -> Optional[bytes]:  # type: ignore
         return self.read(size)
@@ -59,20 +56,43 @@ class BufferableByteStream(BufferedIOBase):
             b = memoryview(b)
             b = b.cast("B")
 
-        if read1:
-            data = self.read1(len(b))
-        else:
-            data = self.read(len(b))
-
-        if data is None:
-            raise BlockingIOError("readinto")
+        start, end = self._next_read(len(b))
+        n = end - start
 
-        n = len(data)
-
-        b[:n] = data
+        with memoryview(self._buffer) as view:
+            b[:n] = view[start:end]
+        self._consume(end)
 
         return n
 
+    def _next_read(self, size: Optional[int]) -> Tuple[int, int]:
+        if not self._chunk_ends and not self.__done:
+            raise BlockingIOError("read")
+        elif not self._chunk_ends or self.closed:
+            return 0, 0
+
+        start = self._read_pos
+        chunk_end = self._chunk_ends[0] - self._offset
+        if size is None or size == -1:
+            return start, chunk_end
+        return start, min(start + max(size, 0), chunk_end)
+
+    def _consume(self, end: int):
+        if not self._chunk_ends:
+            return
+        self._read_pos = end
+        if end == self._chunk_ends[0] - self._offset:
+            self._chunk_ends.popleft()
+
+        if not self._chunk_ends:
+            self._offset += len(self._buffer)
+            self._buffer.clear()
+            self._read_pos = 0
+        elif end > self._COMPACTION_THRESHOLD and end * 2 > len(self._buffer):
+            del self._buffer[:end]
+            self._offset += end
+            self._read_pos = 0
+
     def write(self, b: "ReadableBuffer") -> int:
         if not isinstance(b, bytes):
             type_ = type(b)
@@ -85,7 +105,8 @@ class BufferableByteStream(BufferedIOBase):
             raise IOError("Stream is completed and doesn't support further writes.")
 
         if b:
-            self._byte_chunks.append(b)
+            self._buffer += b
+            self._chunk_ends.append(self._offset + len(self._buffer))
 
         return len(b)
 
@@ -94,7 +115,8 @@ class BufferableByteStream(BufferedIOBase):
         return self.__closed
 
     def close(self):
-        self._buffered_bytes_chunks = None
+        self._buffer = bytearray()
+        self._chunk_ends.clear()
         self.__done = True
         self.__closed = True
 
@@ -12,6 +12,7 @@
 # language governing permissions and limitations under the License.
 
 
+from functools import lru_cache
 from urllib.parse import urlsplit
 from typing import AsyncIterable, Dict
 
@@ -23,16 +24,26 @@ import asyncio
 import time
 
 
-def _add_required_headers(endpoint: str, headers: Dict[str, str]):
-    urlparts = urlsplit(endpoint)
-    if not urlparts.hostname:
+_USER_AGENT = f"transcribe-streaming-sdk-{version}"
+
+
+@lru_cache(maxsize=16)
+def _endpoint_hostname(endpoint: str) -> str:
+    # Clients resolve the same few endpoints for every request, so the
+    # parsed hostname is cached rather than splitting the URL each time
+    hostname = urlsplit(endpoint).hostname
+    if not hostname:
         raise ValidationException(
             "Unexpected endpoint ({endpoint}) provided to serializer"
         )
+    return hostname
+
+
+def _add_required_headers(endpoint: str, headers: Dict[str, str]):
     headers.update(
         {
-            "user-agent": f"transcribe-streaming-sdk-{version}",
-            "host": urlparts.hostname,
+            "user-agent": _USER_AGENT,
+            "host": _endpoint_hostname(endpoint),
         }
     )
 
@@ -35,7 +35,7 @@ setup(
     packages=find_packages(exclude=["tests*"]),
     include_package_data=True,
     install_requires=requires,
-    extras_require={},
+    extras_require={"orjson": ["orjson"]},
     python_requires=">= 3.7",
     license="Apache License 2.0",
     classifiers=[
@@ -1,8 +1,19 @@
+import asyncio
+
 import pytest
 
 from amazon_transcribe import AWSCRTEventLoop
 
 
+@pytest.fixture(scope="module")
+def event_loop():
+    # Share one event loop across the async tests in each module rather than
+    # creating and closing a new loop for every test
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
 @pytest.fixture
 def default_eventloop():
     return AWSCRTEventLoop().bootstrap
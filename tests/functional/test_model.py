@@ -1,10 +1,18 @@
+import subprocess
+import sys
+
 import pytest
 
 from amazon_transcribe.auth import StaticCredentialResolver
 from amazon_transcribe.model import AudioStream
 from amazon_transcribe.serialize import AudioEventSerializer
 from amazon_transcribe.structures import BufferableByteStream
-from amazon_transcribe.eventstream import EventSigner, EventStreamBuffer
+from amazon_transcribe.eventstream import (
+    _MAX_PAYLOAD_LENGTH,
+    EventSigner,
+    EventStreamBuffer,
+    PayloadBytesExceedMaxLength,
+)
 
 
 @pytest.fixture
@@ -50,3 +58,157 @@ class TestAudioStream:
         assert audio_event.headers[":event-type"] == "AudioEvent"
         assert audio_event.headers[":message-type"] == "event"
         assert audio_event.headers[":content-type"] == "application/octet-stream"
+
+    def read_audio_payloads(self, request_body):
+        buffer = EventStreamBuffer()
+        while True:
+            try:
+                data = request_body.read()
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            buffer.add_data(data)
+        payloads = []
+        for signed_event in buffer:
+            if signed_event.payload:
+                inner_buffer = EventStreamBuffer()
+                inner_buffer.add_data(signed_event.payload)
+                payloads.append(next(inner_buffer).payload)
+        return payloads
+
+    @pytest.mark.asyncio
+    async def test_audio_stream_batches_chunks(self, audio_stream, request_body):
+        await audio_stream.send_audio_event(b"foo", flush_immediately=False)
+        await audio_stream.send_audio_event(b"bar", flush_immediately=False)
+        assert self.read_audio_payloads(request_body) == []
+        await audio_stream.end_stream()
+        assert self.read_audio_payloads(request_body) == [b"foobar"]
+
+    @pytest.mark.asyncio
+    async def test_audio_stream_flushes_batch_after_window(
+        self, audio_stream, request_body
+    ):
+        await audio_stream.send_audio_event(b"foo", flush_immediately=False)
+        assert audio_stream._flush_handle is not None
+        # Fire the batch window timer's callback directly
+        audio_stream._flush_handle.cancel()
+        audio_stream._schedule_flush()
+        await audio_stream._flush_task
+        assert self.read_audio_payloads(request_body) == [b"foo"]
+
+    @pytest.mark.asyncio
+    async def test_audio_stream_raises_background_flush_error(
+        self, audio_stream, request_body
+    ):
+        await audio_stream.send_audio_event(b"foo", flush_immediately=False)
+        audio_stream._flush_handle.cancel()
+        original_sign_event = audio_stream._sign_event
+
+        async def failing_sign_event(event_bytes):
+            raise ValueError()
+
+        audio_stream._sign_event = failing_sign_event
+        audio_stream._schedule_flush()
+        with pytest.raises(ValueError):
+            await audio_stream.flush()
+        # The audio is kept and sent with the next flush
+        audio_stream._sign_event = original_sign_event
+        await audio_stream.flush()
+        assert self.read_audio_payloads(request_body) == [b"foo"]
+
+    @pytest.mark.asyncio
+    async def test_audio_stream_sends_empty_chunk_after_batch(
+        self, audio_stream, request_body
+    ):
+        await audio_stream.send_audio_event(b"foo", flush_immediately=False)
+        await audio_stream.send_audio_event(None)
+        assert self.read_audio_payloads(request_body) == [b"foo", b""]
+
+    @pytest.mark.asyncio
+    async def test_audio_stream_does_not_batch_empty_chunk(
+        self, audio_stream, request_body
+    ):
+        await audio_stream.send_audio_event(b"foo", flush_immediately=False)
+        await audio_stream.send_audio_event(b"", flush_immediately=False)
+        assert audio_stream._flush_handle is None
+        assert self.read_audio_payloads(request_body) == [b"foo", b""]
+
+    @pytest.mark.asyncio
+    async def test_audio_stream_flushes_full_batch(self, audio_stream, request_body):
+        chunk = b"a" * (audio_stream._MAX_BATCH_BYTES // 2 + 1)
+        await audio_stream.send_audio_event(chunk, flush_immediately=False)
+        await audio_stream.send_audio_event(chunk, flush_immediately=False)
+        assert self.read_audio_payloads(request_body) == [chunk]
+        await audio_stream.send_audio_event(b"foo")
+        assert self.read_audio_payloads(request_body) == [chunk + b"foo"]
+
+    @pytest.mark.asyncio
+    async def test_audio_stream_sends_many_events(self, audio_stream, request_body):
+        await audio_stream.send_audio_event(b"foo", flush_immediately=False)
+        await audio_stream.send_audio_event_many([b"bar", b"baz"])
+        assert self.read_audio_payloads(request_body) == [b"foo", b"bar", b"baz"]
+
+    @pytest.mark.asyncio
+    async def test_audio_stream_send_many_fails_before_signing(
+        self, audio_stream, request_body
+    ):
+        prior_signature = audio_stream._prior_signature
+        with pytest.raises(TypeError):
+            await audio_stream.send_audio_event_many([b"a", b"b", "x"])
+        assert audio_stream._prior_signature == prior_signature
+        assert self.read_audio_payloads(request_body) == []
+
+    @pytest.mark.asyncio
+    async def test_audio_stream_send_many_rewinds_on_signing_error(
+        self, audio_stream, request_body
+    ):
+        prior_signature = audio_stream._prior_signature
+        original_sign_event = audio_stream._sign_event
+        signed = []
+
+        async def failing_sign_event(event_bytes):
+            if signed:
+                raise ValueError()
+            signed.append(event_bytes)
+            return await original_sign_event(event_bytes)
+
+        audio_stream._sign_event = failing_sign_event
+        with pytest.raises(ValueError):
+            await audio_stream.send_audio_event_many([b"foo", b"bar"])
+        assert audio_stream._prior_signature == prior_signature
+        assert self.read_audio_payloads(request_body) == []
+        # The batch can be resent and chains from the initial signature
+        audio_stream._sign_event = original_sign_event
+        await audio_stream.send_audio_event_many([b"foo", b"bar"])
+        assert self.read_audio_payloads(request_body) == [b"foo", b"bar"]
+
+    @pytest.mark.asyncio
+    async def test_audio_stream_sends_buffer_chunks(self, audio_stream, request_body):
+        audio_chunk = bytearray(b"foo")
+        chunk_view = memoryview(b"bar")
+        await audio_stream.send_audio_event(audio_chunk)
+        await audio_stream.send_audio_event(chunk_view)
+        assert self.read_audio_payloads(request_body) == [b"foo", b"bar"]
+        # The caller's buffer is unlocked and their view is left usable
+        audio_chunk.extend(b"baz")
+        assert chunk_view == b"bar"
+
+    @pytest.mark.asyncio
+    async def test_audio_stream_releases_chunk_on_error(self, audio_stream):
+        audio_chunk = bytearray(_MAX_PAYLOAD_LENGTH + 1)
+        with pytest.raises(PayloadBytesExceedMaxLength) as exc_info:
+            await audio_stream.send_audio_event(audio_chunk)
+        # The traceback keeps the framing frames alive, resizing would fail
+        # with a BufferError if a view of the chunk was still exported
+        assert exc_info.tb is not None
+        audio_chunk.clear()
+
+
+def test_model_import_does_not_load_crt():
+    code = (
+        "import sys\n"
+        "import amazon_transcribe.model, amazon_transcribe.serialize\n"
+        "assert 'awscrt' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
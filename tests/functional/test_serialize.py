@@ -36,6 +36,20 @@ class TestStartStreamTransactionRequest:
         assert "user-agent" in request.headers
         assert isinstance(request.body, BufferableByteStream)
 
+    def test_serialization_optional_headers(self, request_shape):
+        request_shape.session_id = "session"
+        request_shape.show_speaker_label = True
+        request_serializer = TranscribeStreamingSerializer()
+        request = request_serializer.serialize_start_stream_transcription_request(
+            endpoint="https://transcribe.aws.com",
+            request_shape=request_shape,
+        ).prepare()
+
+        assert request.headers["x-amzn-transcribe-session-id"] == "session"
+        assert request.headers["x-amzn-transcribe-show-speaker-label"] == "True"
+        assert "x-amzn-transcribe-vocabulary-name" not in request.headers
+        assert "x-amzn-transcribe-number-of-channels" not in request.headers
+
     def test_serialization_with_missing_endpoint(self, request_shape):
         request_serializer = TranscribeStreamingSerializer()
         with pytest.raises(ValidationException):
@@ -57,3 +71,11 @@ class TestAudioEventSerializer:
         }
         assert headers == expected_headers
         assert payload == b"foo"
+
+    def test_serialization_does_not_copy_chunk(self):
+        audio_chunk = bytearray(b"foo")
+        audio_event = AudioEvent(audio_chunk=audio_chunk)
+        assert audio_event.audio_chunk is audio_chunk
+        event_serializer = AudioEventSerializer()
+        _, payload = event_serializer.serialize(audio_event)
+        assert payload is audio_chunk
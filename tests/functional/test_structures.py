@@ -14,14 +14,11 @@ class TestBufferableByteStream:
     def test_byte_stream_write(self, byte_stream):
         size = byte_stream.write(b"test byte chunk")
         assert size == 15
-        assert byte_stream._byte_chunks == [b"test byte chunk"]
+        assert byte_stream._buffer == b"test byte chunk"
 
         size = byte_stream.write(b"second chunk")
         assert size == 12
-        assert byte_stream._byte_chunks == [
-            b"test byte chunk",
-            b"second chunk",
-        ]
+        assert byte_stream._buffer == b"test byte chunksecond chunk"
 
     @pytest.mark.parametrize(
         "test_input",
@@ -106,3 +103,15 @@ class TestBufferableByteStream:
             byte_stream.read()
         byte_stream.write(b"next")
         assert byte_stream.read() == b"next"
+
+    def test_byte_stream_compacts_consumed_bytes(self, byte_stream):
+        chunk = b"a" * 1024
+        for _ in range(100):
+            byte_stream.write(chunk)
+        for _ in range(99):
+            assert byte_stream.read() == chunk
+        assert len(byte_stream._buffer) < 100 * 1024
+        byte_stream.write(b"next")
+        assert byte_stream.read() == chunk
+        assert byte_stream.read() == b"next"
+        assert byte_stream._buffer == b""
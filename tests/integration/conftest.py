@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from amazon_transcribe.client import TranscribeStreamingClient
+from tests.integration import TEST_WAV_PATH
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+@pytest.fixture(scope="module")
+def event_loop():
+    # uvloop is optional, when it's installed the integration tests run on
+    # its faster event loop. The loop is only created here rather than by
+    # changing the global policy, so the other suites keep the default loop.
+    if uvloop is not None:
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def client():
+    # Streams are created per start_stream_transcription call, so a client
+    # can be shared by every test in a module
+    return TranscribeStreamingClient(region="us-west-2")
+
+
+@pytest.fixture(scope="session")
+def raw_wav_bytes():
+    with open(TEST_WAV_PATH, "rb") as f:
+        return f.read()
@@ -2,31 +2,31 @@ import asyncio
 import pytest
 
 from amazon_transcribe.model import TranscriptEvent
-from amazon_transcribe.client import TranscribeStreamingClient
 from amazon_transcribe.exceptions import (
     BadRequestException,
     SerializationException,
 )
-from tests.integration import TEST_WAV_PATH
 
 
 class TestClientStreaming:
     @pytest.fixture
-    def client(self):
-        return TranscribeStreamingClient(region="us-west-2")
-
-    @pytest.fixture
-    def wav_bytes(self):
-        with open(TEST_WAV_PATH, "rb") as f:
-            raw_bytes = f.read()
+    def wav_bytes(self, raw_wav_bytes):
+        # Chunks are yielded as views of the shared bytes rather than copies
+        raw_bytes = memoryview(raw_wav_bytes)
         # This simulates reading bytes from some asynchronous source
         # This could be coming from an async file, microphone, etc
 
         async def byte_generator():
             chunk_size = 1024 * 4
+            # 16 kHz, 16-bit mono PCM
+            bytes_per_second = 16000 * 2
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
             for i in range(0, len(raw_bytes), chunk_size):
                 yield raw_bytes[i : i + chunk_size]
-                await asyncio.sleep(0.1)
+                # Only wait while we're ahead of the real-time audio position
+                deadline = start_time + (i + chunk_size) / bytes_per_second
+                await asyncio.sleep(max(0, deadline - loop.time()))
 
         return byte_generator
 
@@ -2,13 +2,12 @@ import asyncio
 
 import pytest
 
-from amazon_transcribe.client import TranscribeStreamingClient
 from amazon_transcribe.handlers import TranscriptResultStreamHandler
-from tests.integration import TEST_WAV_PATH
 
 
 class TestEventHandler:
     CHUNK_SIZE = 10 * 1024
+    SEND_BATCH_SIZE = 8
 
     class ExampleStreamHandler(TranscriptResultStreamHandler):
         def __init__(self, *args):
@@ -18,21 +17,25 @@ class TestEventHandler:
         async def handle_transcript_event(self, transcript_event):
             self.result_holder.append(transcript_event)
 
+    async def send_chunks(self, stream, chunks):
+        # Events are signed in a chain so sends can't overlap, instead a few
+        # chunks at a time are signed and written together
+        for i in range(0, len(chunks), self.SEND_BATCH_SIZE):
+            batch = chunks[i : i + self.SEND_BATCH_SIZE]
+            await stream.input_stream.send_audio_event_many(batch)
+
     @pytest.fixture
-    def chunks(self):
-        wav_chunks = []
-        with open(TEST_WAV_PATH, "rb") as f:
-            chunk = f.read(self.CHUNK_SIZE)
-            while chunk:
-                wav_chunks.append(chunk)
-                chunk = f.read(self.CHUNK_SIZE)
-            assert len(wav_chunks) > 0
+    def chunks(self, raw_wav_bytes):
+        wav_view = memoryview(raw_wav_bytes)
+        wav_chunks = [
+            wav_view[i : i + self.CHUNK_SIZE]
+            for i in range(0, len(wav_view), self.CHUNK_SIZE)
+        ]
+        assert len(wav_chunks) > 0
         return wav_chunks
 
     @pytest.mark.asyncio
-    async def test_base_transcribe_handler(self, chunks):
-        client = TranscribeStreamingClient(region="us-west-2")
-
+    async def test_base_transcribe_handler(self, client, chunks):
         stream = await client.start_stream_transcription(
             language_code="en-US",
             media_sample_rate_hz=16000,
@@ -40,18 +43,19 @@ class TestEventHandler:
         )
 
         async def write_chunks():
-            for chunk in chunks:
-                await stream.input_stream.send_audio_event(audio_chunk=chunk)
+            await self.send_chunks(stream, chunks)
             await stream.input_stream.end_stream()
 
         handler = TranscriptResultStreamHandler(stream.output_stream)
-        with pytest.raises(NotImplementedError):
-            await asyncio.gather(write_chunks(), handler.handle_events())
+        write_task = asyncio.ensure_future(write_chunks())
+        try:
+            with pytest.raises(NotImplementedError):
+                await handler.handle_events()
+        finally:
+            await write_task
 
     @pytest.mark.asyncio
-    async def test_extended_transcribe_handler(self, chunks):
-        client = TranscribeStreamingClient(region="us-west-2")
-
+    async def test_extended_transcribe_handler(self, client, chunks):
         stream = await client.start_stream_transcription(
             language_code="en-US",
             media_sample_rate_hz=16000,
@@ -59,10 +63,13 @@ class TestEventHandler:
         )
 
         async def write_chunks():
-            for chunk in chunks:
-                await stream.input_stream.send_audio_event(audio_chunk=chunk)
+            await self.send_chunks(stream, chunks)
             await stream.input_stream.end_stream()
 
         handler = self.ExampleStreamHandler(stream.output_stream)
-        await asyncio.gather(write_chunks(), handler.handle_events())
+        write_task = asyncio.ensure_future(write_chunks())
+        try:
+            await handler.handle_events()
+        finally:
+            await write_task
         assert len(handler.result_holder) > 0
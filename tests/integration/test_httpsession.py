@@ -6,15 +6,14 @@ from amazon_transcribe.httpsession import AwsCrtHttpSessionManager
 
 
 async def json_from_body(response):
-    response_body = BytesIO()
+    chunks = []
     while True:
         chunk = await response.get_chunk()
         if chunk:
-            response_body.write(chunk)
+            chunks.append(chunk)
         else:
             break
-    response_body.seek(0)
-    response_json = json.load(response_body)
+    response_json = json.loads(b"".join(chunks))
     return response_json
 
 
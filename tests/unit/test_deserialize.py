@@ -19,6 +19,49 @@ from amazon_transcribe.exceptions import (
 )
 
 
+# Encoded once rather than for every test run
+TRANSCRIPT_EVENT_PAYLOAD = json.dumps(
+    {
+        "Transcript": {
+            "Results": [
+                {
+                    "Alternatives": [
+                        {
+                            "Items": [
+                                {
+                                    "Content": "Wanted",
+                                    "EndTime": 0.45,
+                                    "StartTime": 0.11,
+                                    "Type": "pronunciation",
+                                    "VocabularyFilterMatch": False,
+                                    "Confidence": 0.82,
+                                    "Stable": False,
+                                },
+                                {
+                                    "Content": "Chief",
+                                    "EndTime": 0.86,
+                                    "StartTime": 0.55,
+                                    "Type": "pronunciation",
+                                    "VocabularyFilterMatch": False,
+                                    "Confidence": 0.9,
+                                    "Stable": True,
+                                },
+                            ],
+                            "Transcript": "Wanted Chief",
+                        }
+                    ],
+                    "EndTime": 0.86,
+                    "IsPartial": True,
+                    "ResultId": "foobar83-265d-4c95-9056-50d14db14710",
+                    "StartTime": 0.11,
+                }
+            ]
+        }
+    }
+).encode("utf-8")
+EXCEPTION_BODY = b'{"message": "exception message"}'
+
+
 @pytest.fixture
 def parser():
     return TranscribeStreamingResponseParser()
@@ -96,8 +139,7 @@ def test_parses_bad_request_exception(error_code, expected_exception_cls, parser
             "x-amzn-ErrorType": error_code,
         }
     )
-    body_bytes = b'{"message": "exception message"}'
-    exception = parser.parse_exception(response, body_bytes)
+    exception = parser.parse_exception(response, EXCEPTION_BODY)
     assert isinstance(exception, expected_exception_cls)
     assert exception.message == "exception message"
 
@@ -108,8 +150,7 @@ def test_parses_exception_message(parser):
             "x-amzn-ErrorType": "BadRequestException",
         }
     )
-    body_bytes = b'{"message": "exception message"}'
-    exception = parser.parse_exception(response, body_bytes)
+    exception = parser.parse_exception(response, EXCEPTION_BODY)
     assert exception.message == "exception message"
 
     body_bytes = b'{"Message": "exception message"}'
@@ -124,8 +165,7 @@ def test_handles_unknown_exception(parser):
             "x-amzn-ErrorType": "FooCode",
         },
     )
-    body_bytes = b'{"message": "exception message"}'
-    exception = parser.parse_exception(response, body_bytes)
+    exception = parser.parse_exception(response, EXCEPTION_BODY)
     assert exception.status_code == 404
     assert exception.error_code == "FooCode"
     assert exception.message == "exception message"
@@ -149,6 +189,13 @@ def test_handles_bad_body_json(parser):
     assert "unknown" in exception.message
 
 
+@pytest.mark.parametrize("body", [b"", b"  \n"])
+def test_handles_empty_body(body, parser):
+    response = Response(status_code=400, headers={})
+    exception = parser.parse_exception(response, body)
+    assert "unknown" in exception.message
+
+
 @pytest.fixture
 def event_parser():
     return TranscribeStreamingEventParser()
@@ -161,44 +208,7 @@ def test_parses_transcript_event(event_parser):
         ":content-type": "application/json",
         ":message-type": "event",
     }
-    json_payload = {
-        "Transcript": {
-            "Results": [
-                {
-                    "Alternatives": [
-                        {
-                            "Items": [
-                                {
-                                    "Content": "Wanted",
-                                    "EndTime": 0.45,
-                                    "StartTime": 0.11,
-                                    "Type": "pronunciation",
-                                    "VocabularyFilterMatch": False,
-                                    "Confidence": 0.82,
-                                    "Stable": False,
-                                },
-                                {
-                                    "Content": "Chief",
-                                    "EndTime": 0.86,
-                                    "StartTime": 0.55,
-                                    "Type": "pronunciation",
-                                    "VocabularyFilterMatch": False,
-                                    "Confidence": 0.9,
-                                    "Stable": True,
-                                },
-                            ],
-                            "Transcript": "Wanted Chief",
-                        }
-                    ],
-                    "EndTime": 0.86,
-                    "IsPartial": True,
-                    "ResultId": "foobar83-265d-4c95-9056-50d14db14710",
-                    "StartTime": 0.11,
-                }
-            ]
-        }
-    }
-    mock_event.payload = json.dumps(json_payload).encode("utf-8")
+    mock_event.payload = TRANSCRIPT_EVENT_PAYLOAD
     event = event_parser.parse(mock_event)
     assert len(event.transcript.results) == 1
     result = event.transcript.results[0]
@@ -12,6 +12,7 @@
 # language governing permissions and limitations under the License.
 """Unit tests for the binary event stream decoder. """
 
+from types import MappingProxyType
 from unittest.mock import Mock
 import pytest
 import uuid
@@ -31,6 +32,7 @@ from amazon_transcribe.eventstream import (
     DecodeUtils,
     EventStream,
     EventStreamMessageSerializer,
+    FrozenHeaders,
     Int8HeaderValue,
     Int16HeaderValue,
     Int32HeaderValue,
@@ -291,6 +293,22 @@ def test_partial_message():
         assert_message_equal(message, EMPTY_MESSAGE[1])
 
 
+def test_buffer_drops_consumed_messages():
+    encoded, decoded = EMPTY_MESSAGE
+    event_buffer = EventStreamBuffer()
+    event_buffer.add_data(encoded + encoded[:5])
+    assert len(list(event_buffer)) == 1
+    # Part of the next message is still pending so nothing is dropped yet
+    event_buffer.add_data(encoded[5:])
+    assert event_buffer._offset == len(encoded)
+    message = next(event_buffer)
+    assert_message_equal(message, decoded)
+    # The buffer is drained so it's emptied when more data arrives
+    event_buffer.add_data(encoded)
+    assert event_buffer._offset == 0
+    assert len(event_buffer._data) == len(encoded)
+
+
 def check_message_decodes(encoded, decoded):
     """Ensure the message decodes to what we expect."""
     event_buffer = EventStreamBuffer()
@@ -355,6 +373,24 @@ def test_header_parser():
     assert headers == expected_headers
 
 
+def test_header_parser_interns_names():
+    headers_data = b"\x0b:event-type\x07\x00\x04test"
+    parser = EventStreamHeaderParser()
+    first_name = next(iter(parser.parse(headers_data)))
+    second_name = next(iter(parser.parse(headers_data)))
+    assert first_name == ":event-type"
+    assert first_name is second_name
+
+
+def test_header_parser_known_names():
+    headers_data = b"\x0d:message-type\x07\x00\x05event"
+    parser = EventStreamHeaderParser()
+    headers = parser.parse(headers_data)
+    assert headers == {":message-type": "event"}
+    name = next(iter(headers))
+    assert name is EventStreamHeaderParser._KNOWN_HEADER_NAMES[b":message-type"]
+
+
 def test_message_prelude_properties():
     """Test that calculated properties from the payload are correct."""
     # Total length: 40, Headers Length: 15, random crc
@@ -586,6 +622,45 @@ class TestEventStreamMessageSerializer:
         encoded_headers = serializer.encode_headers(headers)
         assert b"\x03foo\x07\x00\x03bar" == encoded_headers
 
+    def test_encode_frozen_headers(self, serializer):
+        source = {"foo": "bar"}
+        headers = FrozenHeaders(source)
+        encoded_headers = serializer.encode_headers(headers)
+        assert b"\x03foo\x07\x00\x03bar" == encoded_headers
+        assert serializer.encode_headers(headers) is encoded_headers
+        # Frozen headers hold their own copy of the source mapping
+        source["foo"] = "baz"
+        assert serializer.encode_headers(headers) is encoded_headers
+        other_headers = FrozenHeaders({"foo": "baz"})
+        assert b"\x03foo\x07\x00\x03baz" == serializer.encode_headers(other_headers)
+
+    def test_encode_header_value_subclass(self, serializer):
+        class HeaderStr(str):
+            pass
+
+        headers = {"foo": HeaderStr("bar")}
+        assert b"\x03foo\x07\x00\x03bar" == serializer.encode_headers(headers)
+
+    def test_encode_header_key_cached(self, serializer):
+        encoded_key = serializer._encode_header_key("foo")
+        assert b"\x03foo" == encoded_key
+        assert serializer._encode_header_key("foo") is encoded_key
+
+    def test_encode_timestamp_with_offset(self, serializer):
+        offset = datetime.timezone(datetime.timedelta(hours=5))
+        timestamp = datetime.datetime(2020, 1, 1, 5, 0, 0, 1999, tzinfo=offset)
+        headers = {"foo": timestamp}
+        # 2020-01-01T00:00:00.001Z in milliseconds since the epoch
+        expected = b"\x03foo\x08\x00\x00\x01o^f\xe8\x01"
+        assert expected == serializer.encode_headers(headers)
+
+    def test_encode_read_only_view_not_cached(self, serializer):
+        source = {"foo": "bar"}
+        headers = MappingProxyType(source)
+        assert b"\x03foo\x07\x00\x03bar" == serializer.encode_headers(headers)
+        source["foo"] = "baz"
+        assert b"\x03foo\x07\x00\x03baz" == serializer.encode_headers(headers)
+
     def test_invalid_header_value(self, serializer):
         # Str header value len are stored in a uint16 but cannot be larger
         # than 2 ** 15 - 1
@@ -659,3 +734,12 @@ class TestEventSigner:
             b"\x86\x9c\xdb\xa0Y\x18\x88+\x9b\x10p{n$e"
         )
         assert signed_headers[":chunk-signature"] == expected_signature
+
+    def test_signing_key_tracks_credentials(self, event_signer, credentials):
+        event_signer.sign(b"message", b"prior", credentials)
+        new_credentials = Credentials("foo", "baz", None)
+        signed_headers = event_signer.sign(b"message", b"prior", new_credentials)
+        new_signer = EventSigner("signing-name", "region-name", utc_now=self.utc_now)
+        expected_headers = new_signer.sign(b"message", b"prior", new_credentials)
+        expected_signature = expected_headers[":chunk-signature"]
+        assert signed_headers[":chunk-signature"] == expected_signature
@@ -48,6 +48,15 @@ class TestRequest:
         assert prep.body.read() == BytesIO(b"Test body").read()
         assert prep.query == "test=value"
 
+    def test_request_preparation_copies_headers_dict(self):
+        headers = HeadersDict({"User-Agent": "test-transcribe-0.0.1"})
+        req = Request(endpoint="https://aws.amazon.com", headers=headers)
+        prep = req.prepare()
+        assert prep.headers == headers
+        assert prep.headers is not headers
+        prep.headers["x-amz-date"] = "20200723T223955Z"
+        assert "x-amz-date" not in headers
+
     @pytest.mark.parametrize(
         "endpoint,path,params,expected",
         [
@@ -96,6 +105,20 @@ class TestHeadersDict:
         hdict["test"] = "header"
         assert hdict["test"] == "header"
 
+    def test_headers_dict_case_insensitive(self):
+        hdict = HeadersDict({"Content-Type": "text/plain"})
+        hdict["content-type"] = "application/json"
+        assert hdict["CONTENT-TYPE"] == "application/json"
+        assert "content-TYPE" in hdict
+        assert list(hdict) == ["Content-Type"]
+
+    def test_headers_dict_copy(self):
+        hdict = HeadersDict({"Content-Type": "text/plain"})
+        copied = hdict.copy()
+        copied["content-type"] = "application/json"
+        assert hdict["content-type"] == "text/plain"
+        assert list(copied.items()) == [("Content-Type", "application/json")]
+
     def test_headers_dict_update(self):
         headers = {
             "user-agent": "test-0.0.1",
@@ -8,7 +8,7 @@ from awscrt.auth import (
 from awscrt.http import HttpRequest
 import pytest
 
-from amazon_transcribe.auth import StaticCredentialResolver
+from amazon_transcribe.auth import Credentials, StaticCredentialResolver
 from amazon_transcribe.request import Request
 from amazon_transcribe.signer import (
     RequestSigner,
@@ -39,6 +39,7 @@ def test_convert_request():
     assert crt_req.path == "/transcribe"
     assert dict(crt_req.headers) == dict([("User-Agent", "test-transcribe-0.0.1")])
     assert crt_req.body_stream is not None
+    assert _convert_request(req, include_body=False).body_stream is None
 
 
 def test_default_request_signer(default_credential_resolver):
@@ -80,6 +81,23 @@ def test_sigv4_request_signer(default_credential_resolver):
     assert "x-test-header" in request.headers
 
 
+@pytest.mark.asyncio
+async def test_sigv4_request_signer_sign_async(default_credential_resolver):
+    signer = SigV4RequestSigner("transcribe", "us-west-2")
+    request = Request(
+        endpoint="https://transcribestreaming.amazonaws.com",
+        path="/transcribe",
+        method="HEAD",
+        headers={"x-test-header": "test-transcribe-0.0.1"},
+        body=BytesIO(b"Test body"),
+    ).prepare()
+
+    request = await signer.sign_async(request, default_credential_resolver)
+    assert "Authorization" in request.headers
+    assert "X-Amz-Date" in request.headers
+    assert "x-test-header" in request.headers
+
+
 def test_sigv4_request_signer_handles_no_credentials():
     signer = SigV4RequestSigner("transcribe", "us-west-2")
     request = Request(
@@ -87,3 +105,13 @@ def test_sigv4_request_signer_handles_no_credentials():
     ).prepare()
     with pytest.raises(CredentialsException):
         signer.sign(request, None)
+
+
+def test_request_signer_reuses_credentials_provider():
+    signer = SigV4RequestSigner("transcribe", "us-west-2")
+    credentials = Credentials("test", "53cr37", "12345")
+    provider = signer._get_credentials_provider(credentials)
+    same_credentials = Credentials("test", "53cr37", "12345")
+    assert signer._get_credentials_provider(same_credentials) is provider
+    new_credentials = Credentials("test", "53cr38", "12345")
+    assert signer._get_credentials_provider(new_credentials) is not provider